@@ -0,0 +1,44 @@
+"""add_gmail_thread_id_to_outreach_threads
+
+Store the Gmail thread ID on the outreach thread itself so sending a
+follow-up doesn't need to scan every prior message. Existing threads are
+backfilled from their lowest-sequence message that has a Gmail thread ID.
+
+Revision ID: c4e9a2b7d1f3
+Revises: b2f8d3a1c5e7
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a2b7d1f3'
+down_revision: str = 'b2f8d3a1c5e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('outreach_threads', sa.Column('gmail_thread_id', sa.String(), nullable=True))
+
+    # Backfill from the earliest sent message in each thread
+    op.execute(
+        """
+        UPDATE outreach_threads AS t
+        SET gmail_thread_id = m.gmail_thread_id
+        FROM (
+            SELECT DISTINCT ON (thread_id) thread_id, gmail_thread_id
+            FROM outreach_messages
+            WHERE gmail_thread_id IS NOT NULL AND gmail_thread_id <> ''
+            ORDER BY thread_id, sequence
+        ) AS m
+        WHERE m.thread_id = t.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('outreach_threads', 'gmail_thread_id')
@@ -9,8 +9,18 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""
     GOOGLE_PLACES_API_KEY: str = ""
     APOLLO_API_KEY: str = ""
+    # Query Apollo alongside SMTP verification and prefer its email over
+    # catch-all / pattern guesses (costs an Apollo credit per unverified lookup)
+    APOLLO_PREFER_OVER_GUESS: bool = True
     SERPER_API_KEY: str = ""
     TAVILY_API_KEY: str = ""
+    # How long (seconds) web search results are reused in-process
+    SEARCH_CACHE_TTL: int = 3600
+    # Extra attempts per Claude model on 429/529 before falling back
+    CLAUDE_MAX_RETRIES: int = 1
+    # Max in-flight requests per search provider (keep under their rate limits)
+    SERPER_CONCURRENCY: int = 10
+    TAVILY_CONCURRENCY: int = 5
 
     @property
     def allowed_origins_list(self) -> list[str]:
@@ -52,6 +52,13 @@ async def _log_enrichment_readiness():
         )
 
 
+@app.on_event("shutdown")
+async def _close_http_clients():
+    from app.services import sourcing_service, web_helpers
+    await sourcing_service.close_shared_client()
+    await web_helpers.close_shared_client()
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "version": "0.1.0"}
@@ -94,6 +94,8 @@ class OutreachThread(Base):
     )
     next_follow_up_at: Mapped[datetime | None] = mapped_column(nullable=True)
     last_sent_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    # Gmail thread of the first sent message — later messages reply into it
+    gmail_thread_id: Mapped[str | None] = mapped_column(String, nullable=True)
 
     # Response tracking
     response_received_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -3,12 +3,16 @@ Sourcing Router
 Endpoints for searching external data sources for acquisition targets.
 """
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional
 import logging
 
 from app.dependencies import get_current_user, CurrentUser
-from app.services.sourcing_service import run_sourcing_search, score_company, SourcedCompany, _SEARCH_CACHE
+from app.services.sourcing_service import (
+    run_sourcing_search, score_company, build_scoring_terms, SourcedCompany,
+    is_search_cached, clear_search_cache as clear_cached_searches,
+)
 from app.services.analysis_service import generate_fit_summary, generate_deep_dive
 
 logger = logging.getLogger(__name__)
@@ -91,7 +95,8 @@ class AnalyzeResponse(BaseModel):
 # Endpoints
 # ---------------------------------------------------------------------------
 
-@router.post("/search", response_model=SourcingResponse)
+# Result lists run to ~300 companies — render them with orjson
+@router.post("/search", response_model=SourcingResponse, response_class=ORJSONResponse)
 async def search_companies(
     criteria: SourcingCriteria,
     current_user: CurrentUser = Depends(get_current_user),
@@ -113,8 +118,7 @@ async def search_companies(
             detail="At least one of sector, keywords, or location must be provided.",
         )
 
-    from app.services.sourcing_service import _cache_get, _cache_key
-    was_cached = _cache_get(_cache_key(criteria_dict)) is not None
+    was_cached = is_search_cached(criteria_dict)
 
     try:
         results = await run_sourcing_search(criteria_dict)
@@ -130,7 +134,7 @@ async def search_companies(
     )
 
 
-@router.post("/rescore", response_model=RescoreResponse)
+@router.post("/rescore", response_model=RescoreResponse, response_class=ORJSONResponse)
 async def rescore_companies(
     payload: RescoreRequest,
     current_user: CurrentUser = Depends(get_current_user),
@@ -140,6 +144,7 @@ async def rescore_companies(
     This does NOT make any new external searches — just reruns the scoring logic.
     """
     criteria_dict = payload.criteria.model_dump(exclude_none=True)
+    terms = build_scoring_terms(criteria_dict)
 
     rescored = []
     for item in payload.companies:
@@ -155,7 +160,7 @@ async def rescore_companies(
             asking_price=item.get("asking_price", ""),
             website=item.get("website", ""),
         )
-        score, reasons = score_company(co, criteria_dict)
+        score, reasons = score_company(co, criteria_dict, terms)
         co.fit_score = score
         co.fit_reasons = reasons
         rescored.append(co.to_dict())
@@ -202,7 +207,6 @@ async def clear_search_cache(
     current_user: CurrentUser = Depends(get_current_user),
 ):
     """Clear the in-process sourcing cache so the next search re-fetches fresh data."""
-    count = len(_SEARCH_CACHE)
-    _SEARCH_CACHE.clear()
+    count = clear_cached_searches()
     logger.info(f"[Cache] Cleared {count} cached search result(s) by {current_user.id}")
     return {"cleared": count}
@@ -14,7 +14,7 @@ from typing import Optional
 import httpx
 
 from app.config import settings
-from app.services.web_helpers import fetch_url_text, google_search_text, call_claude_async
+from app.services.web_helpers import fetch_url_text, google_search_text_racing, call_claude_async
 
 logger = logging.getLogger(__name__)
 
@@ -52,19 +52,19 @@ async def _research_company(company: dict) -> dict[str, str]:
         # 2. General Google search
         tasks.append((
             "search_general",
-            google_search_text(client, f'"{name}" {location} business', 2500),
+            google_search_text_racing(client, f'"{name}" {location} business', 2500),
         ))
 
         # 3. Leadership search
         tasks.append((
             "search_leadership",
-            google_search_text(client, f'"{name}" CEO owner president founder {location}', 2000),
+            google_search_text_racing(client, f'"{name}" CEO owner president founder {location}', 2000),
         ))
 
         # 4. News / recent activity
         tasks.append((
             "search_news",
-            google_search_text(client, f'"{name}" {location} 2023 OR 2024 OR 2025', 1500),
+            google_search_text_racing(client, f'"{name}" {location} 2023 OR 2024 OR 2025', 1500),
         ))
 
         keys = [k for k, _ in tasks]
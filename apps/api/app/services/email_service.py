@@ -19,6 +19,7 @@ from app.models.company import Company
 from app.models.contact import Contact
 from app.models.project import Project, ProjectCompany
 from app.models.outreach import OutreachCampaign, OutreachEmail, OutreachThread, OutreachMessage
+from app.services.enrichment_service import unpack_blob
 from app.services.web_helpers import call_claude_async
 
 logger = logging.getLogger(__name__)
@@ -252,7 +253,7 @@ def _enrichment_context(contact: Contact) -> str:
     if not contact.enrichment_data:
         return ""
     extracted = contact.enrichment_data.get("extracted", {})
-    research = contact.enrichment_data.get("research", {})
+    research = unpack_blob(contact.enrichment_data.get("research", {}))
     parts = []
     if extracted:
         parts.append(f"Extracted info: {json.dumps(extracted)}")
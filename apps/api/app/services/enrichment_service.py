@@ -9,15 +9,19 @@ Finds principal owner / decision-maker info for a company via:
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
 import re
+import time
+import zlib
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,11 +30,14 @@ from app.models.company import Company
 from app.models.contact import Contact
 from app.models.project import ProjectCompany
 from app.services.web_helpers import (
+    BROWSER_HEADERS,
     fetch_url_text,
+    html_to_text,
     google_search_text,
     google_search_urls,
     call_claude_async,
     discover_company_website,
+    wait_for_host,
     _is_registry_or_aggregator,
 )
 
@@ -264,7 +271,7 @@ Do not guess or fabricate. Return ONLY a JSON object:
 Use null for unknown fields. The other_contacts array should list any OTHER senior people
 you noticed in the research (up to 3). Return ONLY the JSON. No other text."""
 
-    raw = await call_claude_async(prompt, max_tokens=500)
+    raw = await call_claude_async(prompt, max_tokens=500, cache=True)
 
     # Parse JSON from Claude response
     if raw:
@@ -504,7 +511,7 @@ Return ONLY a JSON object:
 
 Return ONLY the JSON. No other text."""
 
-    raw = await call_claude_async(prompt, max_tokens=600)
+    raw = await call_claude_async(prompt, max_tokens=600, cache=True)
 
     if raw:
         try:
@@ -710,6 +717,69 @@ async def _verify_emails_smtp(candidates: list[str], timeout: float = 5.0) -> li
     return results
 
 
+# Per-page email scrape cache, keyed by sha256(url).
+# Value = {"ts", "etag", "last_modified", "emails"} — only the parsed email
+# list is kept, never the page body. Fresh entries skip the request entirely;
+# stale ones are revalidated with If-None-Match / If-Modified-Since.
+# 404/410 probe paths (/team, /our-team, ...) are cached as an empty list so
+# they aren't refetched on every run.
+_PAGE_EMAIL_CACHE: dict[str, dict] = {}
+_PAGE_EMAIL_CACHE_TTL = 172800  # 2 days
+_PAGE_EMAIL_CACHE_MAX = 5000
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+
+
+def _page_cache_put(key: str, entry: dict) -> None:
+    # Re-insert so dict order tracks recency; drop the oldest past the cap
+    _PAGE_EMAIL_CACHE.pop(key, None)
+    _PAGE_EMAIL_CACHE[key] = entry
+    while len(_PAGE_EMAIL_CACHE) > _PAGE_EMAIL_CACHE_MAX:
+        _PAGE_EMAIL_CACHE.pop(next(iter(_PAGE_EMAIL_CACHE)))
+
+
+async def _fetch_page_emails(client: httpx.AsyncClient, url: str) -> list[str]:
+    """Return the email addresses on one page, using the page cache when possible."""
+    key = hashlib.sha256(url.encode()).hexdigest()
+    entry = _PAGE_EMAIL_CACHE.get(key)
+    now = time.time()
+    if entry and now - entry["ts"] < _PAGE_EMAIL_CACHE_TTL:
+        return entry["emails"]
+
+    headers = dict(BROWSER_HEADERS)
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        await wait_for_host(url)
+        resp = await client.get(url, headers=headers, follow_redirects=True, timeout=12)
+    except Exception as e:
+        logger.debug(f"[Fetch] {url}: {e}")
+        return []
+
+    if resp.status_code == 304 and entry:
+        _page_cache_put(key, {**entry, "ts": now})
+        return entry["emails"]
+    if resp.status_code in (404, 410):
+        _page_cache_put(key, {"ts": now, "etag": "", "last_modified": "", "emails": []})
+        return []
+    if resp.status_code != 200:
+        return []
+
+    text = html_to_text(resp.text, 5000)
+    emails = list(dict.fromkeys(e.lower() for e in _EMAIL_RE.findall(text)))
+    _page_cache_put(key, {
+        "ts": now,
+        "etag": resp.headers.get("etag", ""),
+        "last_modified": resp.headers.get("last-modified", ""),
+        "emails": emails,
+    })
+    return emails
+
+
 async def _scrape_website_emails(
     client: httpx.AsyncClient, website: str
 ) -> list[str]:
@@ -734,10 +804,9 @@ async def _scrape_website_emails(
     all_emails: list[str] = []
     seen: set[str] = set()
 
-    tasks = [fetch_url_text(client, url, 5000) for url in pages]
+    tasks = [_fetch_page_emails(client, url) for url in pages]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    email_pattern = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
     generic_prefixes = {
         "info@", "contact@", "support@", "hello@", "admin@", "sales@",
         "office@", "mail@", "noreply@", "webmaster@", "help@", "enquiries@",
@@ -745,10 +814,8 @@ async def _scrape_website_emails(
     }
 
     for result in results:
-        if isinstance(result, str) and result:
-            emails = email_pattern.findall(result)
-            for email in emails:
-                email_lower = email.lower()
+        if isinstance(result, list) and result:
+            for email_lower in result:
                 if email_lower in seen:
                     continue
                 seen.add(email_lower)
@@ -794,6 +861,7 @@ async def _enrich_with_apollo(
             if domain:
                 search_payload["q_organization_domains"] = domain
 
+            await wait_for_host("https://api.apollo.io/v1/mixed_people/search")
             resp = await client.post(
                 "https://api.apollo.io/v1/mixed_people/search",
                 json=search_payload,
@@ -832,6 +900,7 @@ async def _enrich_with_apollo(
                         "organization_name": company_name,
                         "domain": domain,
                     }
+                    await wait_for_host("https://api.apollo.io/v1/people/match")
                     resp = await client.post(
                         "https://api.apollo.io/v1/people/match",
                         json=finder_payload,
@@ -854,10 +923,39 @@ async def _enrich_with_apollo(
     return {}
 
 
+# ---------------------------------------------------------------------------
+# enrichment_data blob compression
+# ---------------------------------------------------------------------------
+
+# Research/social text blobs above this size are stored zlib-compressed
+_PACK_THRESHOLD = 2048
+
+
+def _pack_blob(d: dict) -> dict:
+    """Compress a large text dict into {"__z__": base64(zlib(json))} for JSONB storage."""
+    raw = json.dumps(d).encode()
+    if len(raw) <= _PACK_THRESHOLD:
+        return d
+    return {"__z__": base64.b64encode(zlib.compress(raw, 6)).decode()}
+
+
+def unpack_blob(d):
+    """Inverse of _pack_blob; returns anything that isn't a packed blob unchanged."""
+    if isinstance(d, dict) and "__z__" in d:
+        return json.loads(zlib.decompress(base64.b64decode(d["__z__"])))
+    return d
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+# Bulk enrichment pipeline: workers per stage, queue sizes, and writer batch size
+ENRICH_STAGE_WORKERS = 3
+ENRICH_STAGE_QUEUE_SIZE = 8
+ENRICH_QUEUE_SIZE = 32
+ENRICH_WRITE_BATCH = 8
+
 async def enrich_company(db: AsyncSession, company_id: str) -> dict:
     """
     Enrich a single company with principal owner info + personality.
@@ -875,10 +973,11 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
     if not company:
         raise ValueError(f"Company {company_id} not found")
 
-    company_name = company.name
-    location = company.hq_location or ""
-    website = company.website or ""
+    return await _enrich_loaded_company(db, company)
+
 
+async def _enrich_loaded_company(db: AsyncSession, company: Company) -> dict:
+    """Run the enrichment pipeline for an already-loaded Company row."""
     # Check if there's already an enriched principal owner
     result = await db.execute(
         select(Contact).where(
@@ -896,7 +995,32 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
             "email": existing.email,
         }
 
+    outcome = await _research_company(
+        company.name, company.hq_location or "", company.website or ""
+    )
+    contact = await _stage_enrichment(db, company.id, company, outcome)
+    await db.commit()
+    await db.refresh(contact)
+    return _enrichment_result(contact, outcome)
+
+
+async def _research_company(company_name: str, location: str, website: str) -> dict:
+    """
+    All network phases of enrichment for one company — no DB access.
+    Returns an outcome dict consumed by _stage_enrichment / _enrichment_result.
+    """
+    st = await _pipeline_research(company_name, location, website)
+    st = await _pipeline_extract(st)
+    return await _pipeline_finish(st)
+
+
+# The three pipeline stages below pass a per-company state dict along, so
+# enrich_project can run different companies in different stages at once.
+
+async def _pipeline_research(company_name: str, location: str, website: str) -> dict:
+    """Stage A: website discovery (Phase 0) + owner web research (Phase 1)."""
     email_discovery: dict = {}
+    discovered_website: str | None = None
 
     # --- Phase 0: Website Discovery ---
     # If website is missing or points to a registry, find the real website
@@ -906,11 +1030,10 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
             discovered = await discover_company_website(client, company_name, location)
         if discovered:
             logger.info(f"[Enrichment] Discovered website: {discovered} for {company_name}")
-            company.website = discovered
+            discovered_website = discovered
             website = discovered
             email_discovery["domain_source"] = "discovered"
             email_discovery["website_discovered"] = discovered
-            await db.flush()
         else:
             logger.info(f"[Enrichment] Could not discover website for {company_name}")
             email_discovery["domain_source"] = "none"
@@ -929,10 +1052,31 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
     logger.info(f"[Enrichment] Phase 1: Researching owner of {company_name}...")
     research = await _research_owner(company_name, location, website)
 
+    return {
+        "company_name": company_name,
+        "location": location,
+        "website": website,
+        "domain": domain,
+        "discovered_website": discovered_website,
+        "email_discovery": email_discovery,
+        "research": research,
+    }
+
+
+async def _pipeline_extract(st: dict) -> dict:
+    """
+    Stage B: Claude extraction, senior fallback (Phase 2), email discovery
+    (Phase 1.5). Also kicks off Phase 3 social scraping in the background.
+    """
+    company_name = st["company_name"]
+    location = st["location"]
+    website = st["website"]
+    domain = st["domain"]
+    research = st["research"]
+
     owner_data = await _extract_owner_with_claude(company_name, location, website, research)
 
     is_fallback_contact = False
-    enrichment_source = "web"
 
     # --- Phase 2: Senior employee fallback ---
     if not owner_data.get("name") and not owner_data.get("email"):
@@ -947,6 +1091,39 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
                 is_fallback_contact = True
                 logger.info(f"[Enrichment] Found senior contact: {owner_data.get('name')} ({owner_data.get('title', '?')}) at {company_name}")
 
+    # Phase 3 social scraping only needs the person's name, so start it now
+    # and let it overlap with email discovery; _pipeline_finish awaits it.
+    social_task = None
+    if owner_data.get("name"):
+        social_task = asyncio.create_task(_scrape_social_profiles(
+            person_name=owner_data["name"],
+            company_name=company_name,
+            linkedin_url=owner_data.get("linkedin_url"),
+            facebook_url=owner_data.get("facebook_url"),
+            location=location,
+        ))
+    try:
+        await _discover_email(st, owner_data)
+    except BaseException:
+        if social_task:
+            social_task.cancel()
+        raise
+
+    st["owner_data"] = owner_data
+    st["is_fallback_contact"] = is_fallback_contact
+    st["social_task"] = social_task
+    return st
+
+
+async def _discover_email(st: dict, owner_data: dict) -> None:
+    """Phase 1.5 + Apollo: fill owner_data["email"], recording how in st."""
+    company_name = st["company_name"]
+    website = st["website"]
+    domain = st["domain"]
+    email_discovery = st["email_discovery"]
+    enrichment_source = "web"
+    apollo_tried = False
+
     # --- Phase 1.5: Email Discovery ---
     # If we found a person's name but no email, try to discover the email
     # Guard: don't guess emails on registry/aggregator domains
@@ -971,6 +1148,14 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
             email_discovery["candidates_tested"] = len(candidates)
 
             if candidates:
+                # Speculatively overlap the Apollo round-trip with the SMTP scan;
+                # its result is only used if SMTP can't verify an address.
+                apollo_task = None
+                if settings.APOLLO_API_KEY and settings.APOLLO_PREFER_OVER_GUESS:
+                    apollo_task = asyncio.create_task(
+                        _enrich_with_apollo(company_name, domain, owner_data.get("name"))
+                    )
+
                 logger.info(f"[Enrichment] Testing {len(candidates)} email candidates for {owner_data['name']}@{domain}...")
                 try:
                     smtp_results = await _verify_emails_smtp(candidates, timeout=5.0)
@@ -1006,8 +1191,29 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
                     email_discovery["method"] = "pattern_guess"
                     email_discovery["verified_email"] = candidates[0]
 
+                if apollo_task:
+                    if email_discovery.get("method") == "smtp_verified":
+                        apollo_task.cancel()
+                    else:
+                        apollo_tried = True
+                        try:
+                            apollo_data = await apollo_task
+                        except Exception as e:
+                            logger.warning(f"[Enrichment] Apollo lookup failed: {e}")
+                            apollo_data = {}
+                        if apollo_data.get("email"):
+                            # Apollo's email beats a catch-all / pattern guess
+                            for key, value in apollo_data.items():
+                                if value and (key == "email" or not owner_data.get(key)):
+                                    owner_data[key] = value
+                            enrichment_source = "apollo"
+                            email_discovery["smtp_method"] = email_discovery.get("method")
+                            email_discovery["method"] = "apollo"
+                            email_discovery["verified_email"] = apollo_data["email"]
+                            logger.info(f"[Enrichment] Preferring Apollo email over SMTP guess: {apollo_data['email']}")
+
     # Apollo enrichment if still no email
-    if not owner_data.get("email") and settings.APOLLO_API_KEY:
+    if not owner_data.get("email") and settings.APOLLO_API_KEY and not apollo_tried:
         logger.info(f"[Enrichment] No email from web/SMTP, trying Apollo for {company_name}...")
         apollo_data = await _enrich_with_apollo(company_name, domain, owner_data.get("name"))
         if apollo_data:
@@ -1019,22 +1225,22 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
                 email_discovery["method"] = "apollo"
                 email_discovery["verified_email"] = apollo_data["email"]
 
+    st["enrichment_source"] = enrichment_source
+
+
+async def _pipeline_finish(st: dict) -> dict:
+    """Stage C: social scraping + personality (Phase 3), then build the outcome."""
+    company_name = st["company_name"]
+    research = st["research"]
+    email_discovery = st["email_discovery"]
+    discovered_website = st["discovered_website"]
+    owner_data = st["owner_data"]
+    is_fallback_contact = st["is_fallback_contact"]
+    enrichment_source = st["enrichment_source"]
+    social_task = st.get("social_task")
+
     # --- Failed: no name and no email ---
     if not owner_data.get("name") and not owner_data.get("email"):
-        contact = await _find_or_create_contact(db, company.id, {
-            "name": f"Owner of {company_name}",
-            "is_principal_owner": True,
-            "enrichment_status": "failed",
-            "enrichment_data": {
-                "research": {k: v[:500] for k, v in research.items()},
-                "email_discovery": email_discovery,
-                "enrichment_version": 2,
-            },
-            "enrichment_source": enrichment_source,
-            "enriched_at": datetime.utcnow(),
-        })
-        await db.commit()
-
         partial: dict = {}
         for field in ("email", "phone", "linkedin_url", "facebook_url"):
             if owner_data.get(field):
@@ -1042,9 +1248,21 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
 
         return {
             "status": "failed",
-            "message": "Could not identify principal owner from available sources. You can add contact info manually.",
-            "contact_id": str(contact.id),
+            "company_name": company_name,
+            "website": discovered_website,
             "partial": partial,
+            "contact_data": {
+                "name": f"Owner of {company_name}",
+                "is_principal_owner": True,
+                "enrichment_status": "failed",
+                "enrichment_data": {
+                    "research": _pack_blob({k: v[:500] for k, v in research.items()}),
+                    "email_discovery": email_discovery,
+                    "enrichment_version": 2,
+                },
+                "enrichment_source": enrichment_source,
+                "enriched_at": datetime.utcnow(),
+            },
         }
 
     # --- Phase 3: Social profile scraping + personality extraction ---
@@ -1052,16 +1270,10 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
     personality_data: dict = {}
     social_profiles: dict[str, str] = {}
 
-    if owner_data.get("name"):
+    if social_task:
         try:
-            logger.info(f"[Enrichment] Phase 3: Scraping social profiles for {contact_name}...")
-            social_profiles = await _scrape_social_profiles(
-                person_name=owner_data["name"],
-                company_name=company_name,
-                linkedin_url=owner_data.get("linkedin_url"),
-                facebook_url=owner_data.get("facebook_url"),
-                location=location,
-            )
+            logger.info(f"[Enrichment] Phase 3: Collecting social profiles for {contact_name}...")
+            social_profiles = await social_task
             if social_profiles:
                 logger.info(f"[Enrichment] Extracting personality for {contact_name} (sources: {list(social_profiles.keys())})")
                 personality_data = await _extract_personality(
@@ -1075,40 +1287,69 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
 
     # --- Create/update Contact ---
     enrichment_data = {
-        "research": {k: v[:500] for k, v in research.items()},
+        "research": _pack_blob({k: v[:500] for k, v in research.items()}),
         "extracted": owner_data,
         "email_discovery": email_discovery,
         "enrichment_version": 2,
         "is_fallback_contact": is_fallback_contact,
     }
     if social_profiles:
-        enrichment_data["social_profiles"] = {k: v[:500] for k, v in social_profiles.items()}
+        enrichment_data["social_profiles"] = _pack_blob({k: v[:500] for k, v in social_profiles.items()})
     if personality_data:
         enrichment_data["personality"] = personality_data
 
-    contact = await _find_or_create_contact(db, company.id, {
-        "name": contact_name,
-        "title": owner_data.get("title"),
-        "email": owner_data.get("email"),
-        "phone": owner_data.get("phone"),
-        "linkedin_url": owner_data.get("linkedin_url"),
-        "facebook_url": owner_data.get("facebook_url"),
-        "is_principal_owner": True,
-        "enrichment_status": "completed",
-        "enrichment_data": enrichment_data,
-        "enrichment_source": enrichment_source,
-        "enriched_at": datetime.utcnow(),
-    })
-
-    await db.commit()
-    await db.refresh(contact)
-
     logger.info(
         f"[Enrichment] Completed: {contact_name} ({owner_data.get('email', 'no email')}) "
         f"for {company_name} | personality={'yes' if personality_data else 'no'} | "
         f"fallback={is_fallback_contact}"
     )
 
+    return {
+        "status": "completed",
+        "company_name": company_name,
+        "website": discovered_website,
+        "enrichment_source": enrichment_source,
+        "has_personality": bool(personality_data),
+        "is_fallback_contact": is_fallback_contact,
+        "contact_data": {
+            "name": contact_name,
+            "title": owner_data.get("title"),
+            "email": owner_data.get("email"),
+            "phone": owner_data.get("phone"),
+            "linkedin_url": owner_data.get("linkedin_url"),
+            "facebook_url": owner_data.get("facebook_url"),
+            "is_principal_owner": True,
+            "enrichment_status": "completed",
+            "enrichment_data": enrichment_data,
+            "enrichment_source": enrichment_source,
+            "enriched_at": datetime.utcnow(),
+        },
+    }
+
+
+async def _stage_enrichment(
+    db: AsyncSession, company_id, company: Company, outcome: dict
+) -> Contact:
+    """
+    Apply a _research_company outcome to the session (caller commits).
+    company_id is passed separately so a Company expired by an earlier
+    rollback is only written to, never read.
+    """
+    if outcome.get("website"):
+        company.website = outcome["website"]
+    return await _find_or_create_contact(db, company_id, outcome["contact_data"])
+
+
+def _enrichment_result(contact: Contact, outcome: dict) -> dict:
+    """Build the API result dict for a committed enrichment outcome."""
+    if outcome["status"] == "failed":
+        return {
+            "status": "failed",
+            "message": "Could not identify principal owner from available sources. You can add contact info manually.",
+            "contact_id": str(contact.id),
+            "partial": outcome["partial"],
+        }
+
     return {
         "status": "completed",
         "contact_id": str(contact.id),
@@ -1118,56 +1359,187 @@ async def enrich_company(db: AsyncSession, company_id: str) -> dict:
         "phone": contact.phone,
         "linkedin_url": contact.linkedin_url,
         "facebook_url": contact.facebook_url,
-        "enrichment_source": enrichment_source,
-        "has_personality": bool(personality_data),
-        "is_fallback_contact": is_fallback_contact,
+        "enrichment_source": outcome["enrichment_source"],
+        "has_personality": outcome["has_personality"],
+        "is_fallback_contact": outcome["is_fallback_contact"],
     }
 
 
 async def enrich_project(db: AsyncSession, project_id: str) -> dict:
     """
     Enrich all companies in a project that don't have an enriched principal owner.
-    Rate-limited to avoid Google blocking.
+    Outbound requests are rate-limited per host (see web_helpers.wait_for_host)
+    to avoid Google blocking.
     Returns summary of results.
     """
+    # One round-trip: LEFT JOIN each project company to its completed principal
+    # owner (if any) so the DB does the "already enriched" filtering in place.
     result = await db.execute(
-        select(ProjectCompany.company_id).where(ProjectCompany.project_id == project_id)
+        select(ProjectCompany.company_id, Contact.id)
+        .join(
+            Contact,
+            and_(
+                Contact.company_id == ProjectCompany.company_id,
+                Contact.is_principal_owner == True,
+                Contact.enrichment_status == "completed",
+            ),
+            isouter=True,
+        )
+        .where(ProjectCompany.project_id == project_id)
     )
-    company_ids = [row[0] for row in result.all()]
+
+    company_ids: list = []
+    seen: set = set()
+    already_enriched: set = set()
+    for cid, contact_id in result.all():
+        if cid not in seen:
+            seen.add(cid)
+            company_ids.append(cid)
+        if contact_id is not None:
+            already_enriched.add(cid)
 
     if not company_ids:
         return {"total": 0, "enriched": 0, "failed": 0, "skipped": 0, "results": []}
 
-    result = await db.execute(
-        select(Contact.company_id).where(
-            Contact.company_id.in_(company_ids),
-            Contact.is_principal_owner == True,
-            Contact.enrichment_status == "completed",
-        )
-    )
-    already_enriched = {row[0] for row in result.all()}
-
     to_enrich = [cid for cid in company_ids if cid not in already_enriched]
 
-    results = []
-    enriched = 0
-    failed = 0
+    # Load every company to enrich in one IN (...) query instead of one
+    # SELECT per company inside the loop.
+    result = await db.execute(select(Company).where(Company.id.in_(to_enrich)))
+    companies_by_id = {c.id: c for c in result.scalars().all()}
+    # Plain-value snapshot for the research stage: a failed batch commit rolls
+    # the session back and expires every loaded Company, and reading an
+    # expired attribute on an AsyncSession raises MissingGreenlet
+    research_inputs = {
+        cid: (c.name, c.hq_location or "", c.website or "")
+        for cid, c in companies_by_id.items()
+    }
+
+    results: list[dict] = []
+
+    # Enrichment runs as a pipeline: research -> Claude extraction -> social +
+    # personality, each stage with its own workers, so while one company waits
+    # on Claude the next one is already being researched. A single writer owns
+    # the DB session and commits finished companies in batches.
+    research_q: asyncio.Queue = asyncio.Queue(maxsize=ENRICH_STAGE_QUEUE_SIZE)
+    extract_q: asyncio.Queue = asyncio.Queue(maxsize=ENRICH_STAGE_QUEUE_SIZE)
+    finish_q: asyncio.Queue = asyncio.Queue(maxsize=ENRICH_STAGE_QUEUE_SIZE)
+    write_q: asyncio.Queue = asyncio.Queue(maxsize=ENRICH_QUEUE_SIZE)
+
+    async def _stage_a(cid, _st) -> dict:
+        return await _pipeline_research(*research_inputs[cid])
 
-    for cid in to_enrich:
+    async def _stage_b(_cid, st: dict) -> dict:
+        return await _pipeline_extract(st)
+
+    async def _stage_c(_cid, st: dict) -> dict:
+        return await _pipeline_finish(st)
+
+    async def _stage_worker(in_q: asyncio.Queue, out_q: asyncio.Queue, fn) -> None:
+        while True:
+            item = await in_q.get()
+            if item is None:
+                return
+            cid, st = item
+            try:
+                st = await fn(cid, st)
+            except Exception as e:
+                await write_q.put((cid, e))
+                continue
+            await out_q.put((cid, st))
+
+    async def _run_stage(in_q: asyncio.Queue, out_q: asyncio.Queue, fn) -> None:
+        await asyncio.gather(*(
+            _stage_worker(in_q, out_q, fn) for _ in range(ENRICH_STAGE_WORKERS)
+        ))
+        # Upstream is drained — tell the next stage's workers to stop
+        if out_q is not write_q:
+            for _ in range(ENRICH_STAGE_WORKERS):
+                await out_q.put(None)
+
+    async def _feed() -> None:
+        for cid in to_enrich:
+            if cid not in research_inputs:
+                await write_q.put((cid, ValueError(f"Company {cid} not found")))
+                continue
+            await research_q.put((cid, None))
+        for _ in range(ENRICH_STAGE_WORKERS):
+            await research_q.put(None)
+
+    async def _write_batch(batch: list[tuple]) -> None:
+        staged: list[tuple] = []
+        for cid, outcome in batch:
+            error = outcome if isinstance(outcome, Exception) else None
+            if error is None:
+                try:
+                    contact = await _stage_enrichment(db, cid, companies_by_id[cid], outcome)
+                    staged.append((cid, contact, outcome))
+                    continue
+                except Exception as e:
+                    error = e
+            logger.error(f"[Enrichment] Error enriching company {cid}: {error}")
+            results.append({"status": "error", "company_id": str(cid), "message": str(error)})
+
+        if not staged:
+            return
         try:
-            res = await enrich_company(db, str(cid))
-            results.append(res)
-            if res["status"] == "completed":
-                enriched += 1
-            else:
-                failed += 1
+            await db.commit()
         except Exception as e:
-            logger.error(f"[Enrichment] Error enriching company {cid}: {e}")
-            failed += 1
-            results.append({"status": "error", "company_id": str(cid), "message": str(e)})
+            await db.rollback()
+            for cid, _, _ in staged:
+                logger.error(f"[Enrichment] Error saving company {cid}: {e}")
+                results.append({"status": "error", "company_id": str(cid), "message": str(e)})
+            return
+        for _, contact, outcome in staged:
+            results.append(_enrichment_result(contact, outcome))
+
+    async def _writer() -> None:
+        while True:
+            item = await write_q.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < ENRICH_WRITE_BATCH and not write_q.empty():
+                item = write_q.get_nowait()
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            start = len(results)
+            try:
+                await _write_batch(batch)
+            except Exception as e:
+                # Keep draining — a dead writer would leave the stage workers
+                # blocked on a full write_q forever
+                logger.exception(f"[Enrichment] Writer failed on batch of {len(batch)}: {e}")
+                reported = {r["company_id"] for r in results[start:] if r["status"] == "error"}
+                for cid, _ in batch:
+                    if str(cid) not in reported:
+                        results.append({"status": "error", "company_id": str(cid), "message": str(e)})
+            if stop:
+                return
+
+    writer = asyncio.create_task(_writer())
+    try:
+        await asyncio.gather(
+            _feed(),
+            _run_stage(research_q, extract_q, _stage_a),
+            _run_stage(extract_q, finish_q, _stage_b),
+            _run_stage(finish_q, write_q, _stage_c),
+        )
+        await write_q.put(None)
+        await writer
+    finally:
+        if not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
 
-        # Rate limit: wait between companies to avoid Google blocking
-        await asyncio.sleep(1.5)
+    enriched = sum(1 for r in results if r["status"] == "completed")
+    failed = len(results) - enriched
 
     return {
         "total": len(company_ids),
@@ -6,10 +6,17 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import concurrent.futures
+import hashlib
 import logging
+import re
+import threading
+import time
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from html import unescape
+from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,17 +26,69 @@ from app.models.outreach import OutreachCampaign, OutreachEmail, OutreachThread,
 
 logger = logging.getLogger(__name__)
 
-# Rate limit: 1 email per N seconds to avoid Gmail throttling
+# Rate limit: 1 email (or campaign batch) per N seconds to avoid Gmail throttling
 SEND_DELAY_SECONDS = 2
 
+# Campaign emails packed into one Gmail batch request (API max is 100)
+SEND_BATCH_SIZE = 50
+
+# Dedicated pool for blocking googleapiclient calls, so Gmail I/O doesn't
+# compete with other work on the loop's default executor
+_GMAIL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix="gmail"
+)
+
+# Strips HTML tags for the plain-text alternative part
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+# Built Gmail clients keyed by sha256(access_token) -> (built_at, service).
+# Google access tokens live ~1h, so reuse a client for at most 30 minutes.
+# Executor threads share this cache, so reads and writes go through the lock.
+_SERVICE_CACHE_TTL = 1800
+_service_cache: dict[str, tuple[float, Any]] = {}
+_service_cache_lock = threading.Lock()
+
 
 def _build_gmail_service(access_token: str):
-    """Build a Gmail API service client from an OAuth access token."""
+    """
+    Build (or reuse) a Gmail API service client for an OAuth access token.
+    Uses the discovery document bundled with googleapiclient, so no network
+    fetch is needed to build a client.
+
+    httplib2.Http is not thread-safe, so the cached client is built with a
+    request builder that gives every request its own AuthorizedHttp — the
+    client can then be used from any executor thread.
+    """
+    key = hashlib.sha256(access_token.encode()).hexdigest()
+    now = time.time()
+    with _service_cache_lock:
+        cached = _service_cache.get(key)
+    if cached and now - cached[0] < _SERVICE_CACHE_TTL:
+        return cached[1]
+
+    import google_auth_httplib2
+    import httplib2
     from google.oauth2.credentials import Credentials
     from googleapiclient.discovery import build
+    from googleapiclient.http import HttpRequest
 
     creds = Credentials(token=access_token)
-    service = build("gmail", "v1", credentials=creds)
+
+    def _request_builder(_http, *args, **kwargs):
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        return HttpRequest(http, *args, **kwargs)
+
+    service = build(
+        "gmail", "v1", credentials=creds, requestBuilder=_request_builder,
+        cache_discovery=False, static_discovery=True,
+    )
+
+    with _service_cache_lock:
+        # Drop expired clients so the cache doesn't grow with every new token
+        for k in [k for k, (ts, _) in _service_cache.items() if now - ts >= _SERVICE_CACHE_TTL]:
+            del _service_cache[k]
+        _service_cache[key] = (now, service)
     return service
 
 
@@ -41,10 +100,7 @@ def _create_message(to: str, subject: str, body_html: str, sender_email: str) ->
     msg["subject"] = subject
 
     # Plain text fallback
-    from html import unescape
-    import re
-    plain_text = re.sub(r"<[^>]+>", "", body_html)
-    plain_text = unescape(plain_text)
+    plain_text = unescape(_TAG_RE.sub("", body_html))
 
     msg.attach(MIMEText(plain_text, "plain"))
     msg.attach(MIMEText(body_html, "html"))
@@ -53,10 +109,54 @@ def _create_message(to: str, subject: str, body_html: str, sender_email: str) ->
     return {"raw": raw}
 
 
-def _send_single_email(service, message: dict) -> str:
-    """Send a single email via Gmail API. Returns message ID."""
-    sent = service.users().messages().send(userId="me", body=message).execute()
-    return sent.get("id", "")
+def _compose_and_send(
+    service,
+    to: str,
+    subject: str,
+    body_html: str,
+    sender_email: str,
+    thread_id: str | None = None,
+) -> dict:
+    """
+    Build the MIME message and send it in one blocking call.
+    Meant to run in an executor so neither the MIME/base64 work nor the
+    HTTP request touches the event loop. Returns the Gmail API response.
+    """
+    message = _create_message(to, subject, body_html, sender_email)
+    if thread_id:
+        message["threadId"] = thread_id
+    return service.users().messages().send(userId="me", body=message).execute()
+
+
+def _send_batch(
+    service, items: list[tuple[str, str, str, str]]
+) -> list[tuple[dict | None, Exception | None]]:
+    """
+    Send several emails in one Gmail batch request (a single multipart POST).
+    items are (to, subject, body_html, sender_email) tuples. Returns one
+    (response, exception) pair per item, in input order. Blocking — run in
+    an executor.
+    """
+    outcomes: list[tuple[dict | None, Exception | None]] = [
+        (None, None) for _ in items
+    ]
+
+    def _callback(request_id: str, response, exception) -> None:
+        outcomes[int(request_id)] = (response, exception)
+
+    batch = service.new_batch_http_request(callback=_callback)
+    for i, (to, subject, body_html, sender_email) in enumerate(items):
+        try:
+            message = _create_message(to, subject, body_html, sender_email)
+        except Exception as e:
+            outcomes[i] = (None, e)
+            continue
+        batch.add(
+            service.users().messages().send(userId="me", body=message),
+            request_id=str(i),
+        )
+    batch.execute()
+    return outcomes
 
 
 async def send_campaign(
@@ -88,40 +188,42 @@ async def send_campaign(
     await db.commit()
 
     # Build Gmail service (sync operation, run in executor)
-    loop = asyncio.get_event_loop()
-    service = await loop.run_in_executor(None, _build_gmail_service, access_token)
+    loop = asyncio.get_running_loop()
+    service = await loop.run_in_executor(_GMAIL_EXECUTOR, _build_gmail_service, access_token)
 
     sent_count = 0
     failed_count = 0
 
-    for email in sendable:
+    for start in range(0, len(sendable), SEND_BATCH_SIZE):
+        chunk = sendable[start:start + SEND_BATCH_SIZE]
+        items = [
+            (e.to_email, e.subject, e.body_html, campaign.sender_email)
+            for e in chunk
+        ]
         try:
-            message = _create_message(
-                to=email.to_email,
-                subject=email.subject,
-                body_html=email.body_html,
-                sender_email=campaign.sender_email,
-            )
-            gmail_id = await loop.run_in_executor(
-                None, _send_single_email, service, message
-            )
-            email.status = "sent"
-            email.gmail_message_id = gmail_id
-            email.sent_at = datetime.utcnow()
-            sent_count += 1
-
-            logger.info(f"[Gmail] Sent email to {email.to_email} (gmail_id={gmail_id})")
-
+            outcomes = await loop.run_in_executor(_GMAIL_EXECUTOR, _send_batch, service, items)
         except Exception as e:
-            email.status = "failed"
-            email.error_message = str(e)[:500]
-            failed_count += 1
-            logger.error(f"[Gmail] Failed to send to {email.to_email}: {e}")
+            # The batch request itself failed — nothing in it was sent
+            outcomes = [(None, e)] * len(chunk)
+
+        for email, (sent, error) in zip(chunk, outcomes):
+            if error is None and sent is not None:
+                gmail_id = sent.get("id", "")
+                email.status = "sent"
+                email.gmail_message_id = gmail_id
+                email.sent_at = datetime.utcnow()
+                sent_count += 1
+                logger.info(f"[Gmail] Sent email to {email.to_email} (gmail_id={gmail_id})")
+            else:
+                email.status = "failed"
+                email.error_message = str(error or "No response from Gmail")[:500]
+                failed_count += 1
+                logger.error(f"[Gmail] Failed to send to {email.to_email}: {error}")
 
         await db.commit()
 
-        # Rate limiting
-        if email != sendable[-1]:
+        # Rate limiting between batches
+        if start + SEND_BATCH_SIZE < len(sendable):
             await asyncio.sleep(SEND_DELAY_SECONDS)
 
     # Update campaign status
@@ -164,31 +266,22 @@ async def send_thread_message(
 
     thread = message.thread
 
-    loop = asyncio.get_event_loop()
-    service = await loop.run_in_executor(None, _build_gmail_service, access_token)
-
-    gmail_msg = _create_message(
-        to=message.to_email,
-        subject=message.subject,
-        body_html=message.body_html,
-        sender_email=sender_email,
-    )
-
-    # If we have a gmail_thread_id from a prior message, thread the reply
-    prior_thread_id = None
-    if thread and thread.messages:
-        for m in sorted(thread.messages, key=lambda x: x.sequence):
-            if m.gmail_thread_id and m.id != message.id:
-                prior_thread_id = m.gmail_thread_id
-                break
+    loop = asyncio.get_running_loop()
+    service = await loop.run_in_executor(_GMAIL_EXECUTOR, _build_gmail_service, access_token)
 
-    if prior_thread_id:
-        gmail_msg["threadId"] = prior_thread_id
+    # If a prior message in this thread was sent, reply into its Gmail thread
+    prior_thread_id = thread.gmail_thread_id if thread else None
 
     try:
         sent = await loop.run_in_executor(
-            None,
-            lambda: service.users().messages().send(userId="me", body=gmail_msg).execute(),
+            _GMAIL_EXECUTOR,
+            _compose_and_send,
+            service,
+            message.to_email,
+            message.subject,
+            message.body_html,
+            sender_email,
+            prior_thread_id,
         )
         gmail_id = sent.get("id", "")
         gmail_tid = sent.get("threadId", "")
@@ -202,6 +295,8 @@ async def send_thread_message(
         if thread:
             thread.status = "awaiting_response"
             thread.last_sent_at = datetime.utcnow()
+            if not thread.gmail_thread_id and gmail_tid:
+                thread.gmail_thread_id = gmail_tid
             if message.message_type == "follow_up":
                 thread.follow_up_count = (thread.follow_up_count or 0) + 1
 
@@ -13,24 +13,56 @@ Sector is free-text — matched against listing text via keyword overlap.
 Results are cached in-process for 30 minutes to avoid repeated slow network calls.
 """
 import asyncio
+import heapq
+import io
 import re
 import logging
+import sys
 import time
-import xml.etree.ElementTree as ET
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Optional
 from urllib.parse import urlencode
 
 import httpx
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from lxml import etree
+from lxml.html import fragment_fromstring
+
+from app.services.web_helpers import _el_text, _has_class, _parse_html
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Simple in-process TTL cache (30 minutes)
-# Key = frozenset of criteria items; Value = (timestamp, results_list)
+# In-process TTL cache (30 minutes, at most 256 searches)
+# Key = stable string of criteria items; Value = [hits, last_access, results]
 # ---------------------------------------------------------------------------
-_SEARCH_CACHE: dict[str, tuple[float, list[dict]]] = {}
 _CACHE_TTL = 1800  # 30 minutes
+_CACHE_MAXSIZE = 256
+# Near-empty result sets usually mean the sources were blocked or timed out —
+# don't pin those for 30 minutes.
+_CACHE_MIN_RESULTS = 5
+
+
+class _SearchCache(TTLCache):
+    """
+    TTLCache whose size-triggered eviction keeps frequently requested searches:
+    the victim is the entry with the lowest hits + recency rank (0 = stalest)
+    rather than simply the least recently used one.
+    """
+
+    def popitem(self):
+        entries = {k: self[k] for k in list(self)}
+        if not entries:
+            return super().popitem()
+        by_recency = sorted(entries, key=lambda k: entries[k][1])
+        rank = min(range(len(by_recency)), key=lambda r: entries[by_recency[r]][0] + r)
+        key = by_recency[rank]
+        return key, self.pop(key)
+
+
+_SEARCH_CACHE: _SearchCache = _SearchCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
 
 
 def _cache_key(criteria: dict) -> str:
@@ -40,18 +72,29 @@ def _cache_key(criteria: dict) -> str:
 
 def _cache_get(key: str) -> list[dict] | None:
     entry = _SEARCH_CACHE.get(key)
-    if entry and (time.time() - entry[0]) < _CACHE_TTL:
-        return entry[1]
-    return None
+    if entry is None:
+        return None
+    entry[0] += 1
+    entry[1] = time.monotonic()
+    return entry[2]
 
 
 def _cache_set(key: str, results: list[dict]) -> None:
-    _SEARCH_CACHE[key] = (time.time(), results)
-    # Evict entries older than TTL
-    now = time.time()
-    stale = [k for k, (ts, _) in _SEARCH_CACHE.items() if now - ts > _CACHE_TTL]
-    for k in stale:
-        _SEARCH_CACHE.pop(k, None)
+    if len(results) < _CACHE_MIN_RESULTS:
+        return
+    _SEARCH_CACHE[key] = [0, time.monotonic(), results]
+
+
+def is_search_cached(criteria: dict) -> bool:
+    """True if a live cache entry exists for these criteria (does not count as a hit)."""
+    return _cache_key(criteria) in _SEARCH_CACHE
+
+
+def clear_search_cache() -> int:
+    """Drop every cached search; returns how many entries were removed."""
+    count = len(_SEARCH_CACHE)
+    _SEARCH_CACHE.clear()
+    return count
 
 
 BROWSER_HEADERS = {
@@ -68,6 +111,41 @@ BROWSER_HEADERS = {
 
 TIMEOUT = httpx.Timeout(30.0)
 
+# ---------------------------------------------------------------------------
+# Shared HTTP client — one connection pool (HTTP/2 where the host supports it)
+# reused across every listing source so TLS handshakes are paid once per host.
+# ---------------------------------------------------------------------------
+# Keep-alive sized for the 15 Craigslist city subdomains (each its own origin)
+# plus the listing hosts, held long enough to span back-to-back searches.
+_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0)
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the process-wide sourcing client, creating it on first use."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        # Pool/HTTP2 settings live on the transport (the client ignores its own
+        # http2/limits args when a transport is given); retries=1 re-attempts
+        # connection failures only, never a request that reached the server.
+        # BROWSER_HEADERS are set once here; the scrapers below rely on them
+        # rather than passing headers= on every request.
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=_CLIENT_LIMITS, retries=1)
+        _SHARED_CLIENT = httpx.AsyncClient(
+            transport=transport,
+            timeout=TIMEOUT,
+            headers=BROWSER_HEADERS,
+        )
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """Close the shared client (called on app shutdown)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
 # ---------------------------------------------------------------------------
 # DealStream RSS category feeds — all return 25 real, distinct items
 # ---------------------------------------------------------------------------
@@ -88,78 +166,163 @@ CRAIGSLIST_CITIES = [
     "miami", "atlanta", "boston", "seattle", "denver",
     "phoenix", "sandiego", "minneapolis", "portland", "austin",
 ]
+# Location words → Craigslist city slug
+CRAIGSLIST_CITY_MAP = {
+    "new york": "newyork", "ny": "newyork", "nyc": "newyork",
+    "chicago": "chicago", "il": "chicago",
+    "dallas": "dallas", "tx": "dallas", "texas": "dallas",
+    "houston": "houston",
+    "los angeles": "losangeles", "la": "losangeles", "ca": "losangeles", "california": "losangeles",
+    "miami": "miami", "fl": "miami", "florida": "miami",
+    "atlanta": "atlanta", "ga": "atlanta", "georgia": "atlanta",
+    "boston": "boston", "ma": "boston",
+    "seattle": "seattle", "wa": "seattle",
+    "denver": "denver", "co": "denver", "colorado": "denver",
+    "phoenix": "phoenix", "az": "phoenix",
+    "san diego": "sandiego",
+    "minneapolis": "minneapolis", "mn": "minneapolis",
+    "portland": "portland", "or": "portland",
+    "austin": "austin",
+}
+# Craigslist 429s bursts of parallel hits — cap in-flight city fetches
+CRAIGSLIST_MAX_CONCURRENCY = 5
+
+
+# ---------------------------------------------------------------------------
+# Precompiled lxml selectors — CSS selectors hand-translated to XPath once at
+# import instead of being re-parsed by BeautifulSoup on every .select() call.
+# Page parsing itself runs via asyncio.to_thread: lxml releases the GIL while
+# building the tree, so a large page doesn't stall the other in-flight sources.
+# ---------------------------------------------------------------------------
+
+def _first(xp: etree.XPath, el) -> Optional[etree._Element]:
+    found = xp(el)
+    return found[0] if found else None
+
+
+_FIRST_LINK_XP = etree.XPath("(.//a[@href])[1]")
+
+# Craigslist
+_CL_ITEM_XP = etree.XPath(f"//li[{_has_class('cl-static-search-result')}]")
+_CL_TITLE_XP = etree.XPath(f"(.//*[{_has_class('label')}] | .//a | .//*[{_has_class('title')}])[1]")
+_CL_PRICE_XP = etree.XPath("(.//*[contains(@class, 'price')])[1]")
+_CL_META_XP = etree.XPath(f"(.//*[contains(@class, 'meta') or {_has_class('supertitle')}])[1]")
+
+# QuietLight
+_QL_BODY_XP = etree.XPath(f"(.//*[{_has_class('listing-card__body')}])[1]")
+_QL_NAME_XP = etree.XPath("(.//h2 | .//h3 | .//h4 | .//strong | .//*[contains(@class, 'title')])[1]")
+_QL_BOTTOM_XP = etree.XPath(
+    "(.//*[contains(@class, 'bottom') or contains(@class, 'category') or contains(@class, 'type')])[1]"
+)
+
+# EmpireFlippers
+_EF_CARD_XP = etree.XPath(f"//*[{_has_class('listing-item')}]")
+_EF_NUM_XP = etree.XPath(f"(.//*[{_has_class('listing-number')}])[1]")
+_EF_DETAILS_XP = etree.XPath("(.//*[contains(@class, 'details')])[1]")
+_EF_TITLE_XP = etree.XPath(
+    "(.//h2 | .//h3 | .//h4 | .//*[contains(@class, 'title') or contains(@class, 'heading')"
+    " or contains(@class, 'name')])[1]"
+)
+_EF_PRICE_XP = etree.XPath(f"(.//*[{_has_class('listing-price')}])[1]")
+
+# FE International (Webflow CMS items)
+_FE_ITEM_XP = etree.XPath(f"//*[{_has_class('w-dyn-item')}]")
+_FE_NAME_XP = etree.XPath(
+    "(.//h1 | .//h2 | .//h3 | .//h4 | .//strong"
+    " | .//*[contains(@class, 'title') or contains(@class, 'heading')])[1]"
+)
+_FE_DESC_XP = etree.XPath("(.//p | .//*[contains(@class, 'desc') or contains(@class, 'summary')])[1]")
+_FE_PRICE_XP = etree.XPath("(.//*[contains(@class, 'price') or contains(@class, 'asking')])[1]")
+
+# Axial
+_AX_ARTICLE_XP = etree.XPath(f"//article[{_has_class('teaser1')}]")
+_AX_IMG_XP = etree.XPath("(.//img[@alt])[1]")
+_AX_NAME_XP = etree.XPath("(.//*[@itemprop='name'] | .//h2 | .//h3)[1]")
+_AX_LINK_XP = etree.XPath("(.//a[@itemprop='url'] | .//a[@href])[1]")
+_AX_DESC_XP = etree.XPath("(.//p | .//*[@itemprop='description'])[1]")
 
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True, eq=False)
 class SourcedCompany:
-    def __init__(
-        self,
-        name: str,
-        source: str,
-        source_url: str = "",
-        description: str = "",
-        sector: str = "",
-        location: str = "",
-        revenue: str = "",
-        employees: str = "",
-        asking_price: str = "",
-        website: str = "",
-        extra: dict | None = None,
-    ):
-        self.name = name
-        self.source = source
-        self.source_url = source_url
-        self.description = description
-        self.sector = sector
-        self.location = location
-        self.revenue = revenue
-        self.employees = employees
-        self.asking_price = asking_price
-        self.website = website
-        self.extra = extra or {}
-        self.fit_score: Optional[int] = None
-        self.fit_reasons: list[str] = []
+    # Slotted — hundreds of these live in the search cache, no per-instance __dict__
+    name: str
+    source: str
+    source_url: str = ""
+    description: str = ""
+    sector: str = ""
+    location: str = ""
+    revenue: str = ""
+    employees: str = ""
+    asking_price: str = ""
+    website: str = ""
+    extra: dict | None = None
+    fit_score: Optional[int] = field(default=None, init=False)
+    fit_reasons: list[str] = field(default_factory=list, init=False)
+    # Lowercased "name description location", built on first score (not serialized)
+    _search_text: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Source and sector repeat across most results — share one str object
+        self.source = sys.intern(self.source or "")
+        self.sector = sys.intern(self.sector or "")
+        if self.extra is None:
+            self.extra = {}
 
     def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "source": self.source,
-            "source_url": self.source_url,
-            "description": self.description,
-            "sector": self.sector,
-            "location": self.location,
-            "revenue": self.revenue,
-            "employees": self.employees,
-            "asking_price": self.asking_price,
-            "website": self.website,
-            "fit_score": self.fit_score,
-            "fit_reasons": self.fit_reasons,
-            "extra": self.extra,
-        }
+        # Shallow on purpose: dataclasses.asdict would deep-copy extra/fit_reasons
+        return {f: getattr(self, f) for f in _SOURCED_COMPANY_FIELDS}
+
+
+_SOURCED_COMPANY_FIELDS = tuple(f.name for f in fields(SourcedCompany) if not f.name.startswith("_"))
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_RE_MONEY = re.compile(
+    r"\$[\d,]+(?:\.\d+)?\s*(?:[MKBmkb]|million|thousand|billion)?", re.IGNORECASE
+)
+_RE_LOCATION = re.compile(r"([A-Z][a-zA-Z\s]{2,20}),\s*([A-Z]{2})\b")
+# Separator → space tables; str.translate + split() beats a regex split here
+_KEYWORD_SEP_TRANS = str.maketrans({",": " ", "/": " ", "&": " "})
+_TOKEN_SEP_TRANS = str.maketrans({",": " ", "/": " ", "&": " ", "-": " "})
+_RE_REVENUE = re.compile(r"[Rr]evenue[:\s]+(\$[\d,\.]+\s*[MKBmkb]?)")
+_RE_EF_LISTING = re.compile(
+    r"(?:New Listing|Listing)\s+([A-Z][a-zA-Z\s&,/]+?)(?:\s+Monetization|\s+\$|\s+Unlock)"
+)
+_RE_EF_SUFFIX = re.compile(r"\s*\(#\d+\)\s*$")
+
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    One alternation regex over all keywords (lowercased), so filtering an item
+    is a single scan of its text instead of one substring scan per keyword.
+    Match against lowercased text. Returns None when there is nothing to match.
+    """
+    kws = {kw.lower() for kw in keywords if len(kw) > 1}
+    if not kws:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in kws))
+
+
 def _text_matches_any(text: str, keywords: list[str]) -> bool:
-    t = text.lower()
-    return any(kw.lower() in t for kw in keywords if len(kw) > 1)
+    pattern = _keyword_pattern(tuple(keywords))
+    return bool(pattern and pattern.search(text.lower()))
 
 
 def _extract_money(text: str) -> str:
-    m = re.search(
-        r"\$[\d,]+(?:\.\d+)?\s*(?:[MKBmkb]|million|thousand|billion)?",
-        text, re.IGNORECASE
-    )
+    m = _RE_MONEY.search(text)
     return m.group(0) if m else ""
 
 
 def _extract_location(text: str) -> str:
-    m = re.search(r"([A-Z][a-zA-Z\s]{2,20}),\s*([A-Z]{2})\b", text)
+    m = _RE_LOCATION.search(text)
     return m.group(0) if m else ""
 
 
@@ -171,17 +334,21 @@ def _build_search_keywords(sector: str, keywords: str) -> list[str]:
     Still used for source-level filtering where both are treated equally.
     """
     combined = f"{sector} {keywords}".strip()
-    words = re.split(r"[\s,/&]+", combined)
+    words = combined.translate(_KEYWORD_SEP_TRANS).split()
     return [w.lower().strip() for w in words if len(w.strip()) > 2]
 
 
+_STOP_WORDS = frozenset({
+    "for", "and", "the", "with", "from", "that", "this", "are", "has",
+    "have", "been", "will", "its", "was", "our", "not", "but", "can",
+})
+
+
 def _tokenize(text: str) -> list[str]:
     """Split free-text into lowercase tokens, drop stop words and short tokens."""
-    STOP = {"for", "and", "the", "with", "from", "that", "this", "are", "has",
-            "have", "been", "will", "its", "was", "our", "not", "but", "can"}
-    words = re.split(r"[\s,/&\-]+", text.strip())
+    words = text.translate(_TOKEN_SEP_TRANS).split()
     return [w.lower().strip("().") for w in words
-            if len(w.strip()) > 2 and w.lower() not in STOP]
+            if len(w.strip()) > 2 and w.lower() not in _STOP_WORDS]
 
 
 def _build_sector_kws(sector: str) -> list[str]:
@@ -271,19 +438,8 @@ _STATE_NAME_TO_ABBREV: dict[str, str] = {
 _ABBREV_TO_STATE_NAME: dict[str, str] = {v: k for k, v in _STATE_NAME_TO_ABBREV.items()}
 
 
-def _build_location_filter_terms(location: str) -> set[str]:
-    """Build the set of terms a result's location must contain to pass the filter.
-
-    For a city like "houston" → {"houston", "tx", "texas"}
-    For a state like "california" → {"california", "ca"}
-    For an abbreviation like "tx" → {"tx", "texas"}
-
-    Returns empty set when no location specified (= no filter).
-    """
-    loc = location.lower().strip()
-    if not loc:
-        return set()
-
+def _location_terms_for(loc: str) -> frozenset[str]:
+    """Expand a normalized (lowercased, stripped, non-empty) location into filter terms."""
     terms: set[str] = set()
 
     # Add raw location words (skip short ones like "of", "in")
@@ -308,12 +464,43 @@ def _build_location_filter_terms(location: str) -> set[str]:
     if state_name:
         terms.add(state_name)
 
-    return terms
+    return frozenset(terms)
+
+
+# Every known city / state name / abbreviation → its full term set, built once
+_LOCATION_TERMS: dict[str, frozenset[str]] = {
+    key: _location_terms_for(key)
+    for key in (*_CITY_TO_STATE, *_STATE_NAME_TO_ABBREV, *_ABBREV_TO_STATE_NAME)
+}
+
+
+def _build_location_filter_terms(location: str) -> frozenset[str]:
+    """Build the set of terms a result's location must contain to pass the filter.
+
+    For a city like "houston" → {"houston", "tx", "texas"}
+    For a state like "california" → {"california", "ca"}
+    For an abbreviation like "tx" → {"tx", "texas"}
+
+    Returns empty set when no location specified (= no filter).
+    """
+    loc = location.lower().strip()
+    if not loc:
+        return frozenset()
+    terms = _LOCATION_TERMS.get(loc)
+    if terms is not None:
+        return terms
+    return _location_terms_for(loc)
+
+
+@lru_cache(maxsize=128)
+def _location_regex(terms: frozenset[str]) -> re.Pattern:
+    """One alternation over all filter terms — a single pass per location string."""
+    return re.compile("|".join(re.escape(t) for t in terms))
 
 
 def _result_passes_location_filter(
     co: "SourcedCompany",
-    filter_terms: set[str],
+    filter_terms: frozenset[str],
 ) -> bool:
     """Return True if the result's location matches any of the filter terms.
 
@@ -327,20 +514,29 @@ def _result_passes_location_filter(
         return False  # no location data → can't confirm match → exclude
 
     # Check if any filter term appears in the result's location field
-    return any(term in result_loc for term in filter_terms)
+    return _location_regex(frozenset(filter_terms)).search(result_loc) is not None
 
 
 # ---------------------------------------------------------------------------
 # Source 1: DealStream RSS feeds
 # ---------------------------------------------------------------------------
 
+# C-level XML parser for RSS — no entity expansion or network access
+_RSS_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, recover=True)
+
+# Fallback tag stripper for descriptions lxml can't parse as a fragment
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 async def _fetch_rss_feed(client: httpx.AsyncClient, slug: str) -> list[dict]:
     url = f"https://www.dealstream.com/{slug}.rss"
     try:
-        resp = await client.get(url, headers=BROWSER_HEADERS, follow_redirects=True)
+        resp = await client.get(url, follow_redirects=True)
         if resp.status_code != 200:
             return []
-        root = ET.fromstring(resp.text)
+        root = etree.fromstring(resp.content, parser=_RSS_PARSER)
+        if root is None:
+            return []
         items = []
         for item in root.findall(".//item"):
             title = (item.findtext("title") or "").strip()
@@ -349,7 +545,13 @@ async def _fetch_rss_feed(client: httpx.AsyncClient, slug: str) -> list[dict]:
             link = item.findtext("link") or ""
             desc_raw = item.findtext("description") or ""
             # Strip HTML tags from description
-            desc = BeautifulSoup(desc_raw, "lxml").get_text(" ", strip=True)[:500]
+            try:
+                frag = fragment_fromstring(desc_raw, create_parent="div")
+                desc = " ".join(frag.itertext())
+            except Exception:
+                desc = _TAG_RE.sub(" ", desc_raw)
+            # One space between block/<br> texts, then collapse whitespace runs
+            desc = " ".join(desc.split())[:500]
             items.append({
                 "name": title,
                 "description": desc,
@@ -371,48 +573,69 @@ async def search_dealstream_rss(
     location_words: list[str],
     sector: str,
 ) -> list[SourcedCompany]:
-    """Fetch all RSS feeds in parallel, filter by keywords."""
-    tasks = [_fetch_rss_feed(client, slug) for slug in DEALSTREAM_RSS_FEEDS]
-    results_nested = await asyncio.gather(*tasks, return_exceptions=True)
-
-    all_raw: list[dict] = []
-    for r in results_nested:
-        if isinstance(r, list):
-            all_raw.extend(r)
-
-    logger.info(f"[DealStream RSS] Total raw: {len(all_raw)}, filtering by: {match_kws[:8]}")
-
+    """
+    Fetch all RSS feeds in parallel, filter by keywords.
+    Each feed is filtered as soon as it arrives (as_completed) so the
+    per-item work overlaps with the feeds still in flight.
+    """
+    tasks = [asyncio.create_task(_fetch_rss_feed(client, slug)) for slug in DEALSTREAM_RSS_FEEDS]
+    kw_re = _keyword_pattern(tuple(match_kws))
     results: list[SourcedCompany] = []
-    for item in all_raw:
-        combined = f"{item['name']} {item['description']}".lower()
-
-        # Keyword filter
-        if match_kws and not _text_matches_any(combined, match_kws):
+    seen_urls: set[str] = set()  # the category feeds overlap
+    total_raw = 0
+    for next_feed in asyncio.as_completed(tasks):
+        try:
+            feed_items = await next_feed
+        except Exception:
             continue
+        total_raw += len(feed_items)
+        for item in feed_items:
+            _append_rss_item(results, seen_urls, item, kw_re, location_words, sector)
 
-        # Location tagging
-        item_loc = item.get("location", "")
-        if location_words:
-            loc_confirmed = any(w in combined for w in location_words)
-            display_loc = item_loc or ("" if not loc_confirmed else "")
-        else:
-            display_loc = item_loc
-
-        results.append(SourcedCompany(
-            name=item["name"],
-            source="DealStream",
-            source_url=item.get("url", ""),
-            description=item["description"][:350],
-            sector=sector,
-            location=display_loc,
-            revenue=item.get("price", ""),
-            asking_price=item.get("price", ""),
-        ))
-
+    logger.info(f"[DealStream RSS] Total raw: {total_raw}, filtering by: {match_kws[:8]}")
     logger.info(f"[DealStream RSS] After filter: {len(results)}")
     return results
 
 
+def _append_rss_item(
+    results: list[SourcedCompany],
+    seen_urls: set[str],
+    item: dict,
+    kw_re: Optional[re.Pattern],
+    location_words: list[str],
+    sector: str,
+) -> None:
+    url = item.get("url", "")
+    if url and url in seen_urls:
+        return
+    combined = f"{item['name']} {item['description']}".lower()
+
+    # Keyword filter
+    if kw_re is not None and not kw_re.search(combined):
+        return
+
+    # Location tagging
+    item_loc = item.get("location", "")
+    if location_words:
+        loc_confirmed = any(w in combined for w in location_words)
+        display_loc = item_loc or ("" if not loc_confirmed else "")
+    else:
+        display_loc = item_loc
+
+    if url:
+        seen_urls.add(url)
+    results.append(SourcedCompany(
+        name=item["name"],
+        source="DealStream",
+        source_url=url,
+        description=item["description"][:350],
+        sector=sector,
+        location=display_loc,
+        revenue=item.get("price", ""),
+        asking_price=item.get("price", ""),
+    ))
+
+
 # ---------------------------------------------------------------------------
 # Source 2: Craigslist business-for-sale (multi-city)
 # ---------------------------------------------------------------------------
@@ -424,30 +647,30 @@ async def _fetch_craigslist_city(
 ) -> list[dict]:
     url = f"https://{city}.craigslist.org/search/bfs?{urlencode({'query': query})}"
     try:
-        resp = await client.get(url, headers=BROWSER_HEADERS, follow_redirects=True)
+        resp = await client.get(url, follow_redirects=True)
         if resp.status_code != 200:
             return []
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = await asyncio.to_thread(_parse_html, resp.text)
         items = []
-        for li in soup.select("li.cl-static-search-result"):
-            title_el = li.select_one(".label, a, .title")
-            if not title_el:
+        for li in _CL_ITEM_XP(tree):
+            title_el = _first(_CL_TITLE_XP, li)
+            if title_el is None:
                 continue
-            title = title_el.get_text(strip=True)
+            title = _el_text(title_el)
             if not title or len(title) < 4:
                 continue
 
-            link_el = li.select_one("a[href]")
-            link = link_el["href"] if link_el else ""
+            link_el = _first(_FIRST_LINK_XP, li)
+            link = link_el.get("href") if link_el is not None else ""
             if link and not link.startswith("http"):
                 link = f"https://{city}.craigslist.org{link}"
 
-            price_el = li.select_one(".priceinfo, .price, [class*=price]")
-            price = price_el.get_text(strip=True) if price_el else ""
+            price_el = _first(_CL_PRICE_XP, li)
+            price = _el_text(price_el) if price_el is not None else ""
 
-            meta_el = li.select_one(".meta, .supertitle, [class*=meta]")
-            meta = meta_el.get_text(strip=True) if meta_el else ""
+            meta_el = _first(_CL_META_XP, li)
+            meta = _el_text(meta_el) if meta_el is not None else ""
 
             items.append({
                 "name": title,
@@ -484,25 +707,8 @@ async def search_craigslist(
     if location_words:
         # Map location words to city slugs
         loc_str = " ".join(location_words).lower()
-        city_map = {
-            "new york": "newyork", "ny": "newyork", "nyc": "newyork",
-            "chicago": "chicago", "il": "chicago",
-            "dallas": "dallas", "tx": "dallas", "texas": "dallas",
-            "houston": "houston",
-            "los angeles": "losangeles", "la": "losangeles", "ca": "losangeles", "california": "losangeles",
-            "miami": "miami", "fl": "miami", "florida": "miami",
-            "atlanta": "atlanta", "ga": "atlanta", "georgia": "atlanta",
-            "boston": "boston", "ma": "boston",
-            "seattle": "seattle", "wa": "seattle",
-            "denver": "denver", "co": "denver", "colorado": "denver",
-            "phoenix": "phoenix", "az": "phoenix",
-            "san diego": "sandiego",
-            "minneapolis": "minneapolis", "mn": "minneapolis",
-            "portland": "portland", "or": "portland",
-            "austin": "austin",
-        }
         cities_to_search = []
-        for key, city in city_map.items():
+        for key, city in CRAIGSLIST_CITY_MAP.items():
             if key in loc_str and city not in cities_to_search:
                 cities_to_search.append(city)
         if not cities_to_search:
@@ -510,21 +716,35 @@ async def search_craigslist(
     else:
         cities_to_search = CRAIGSLIST_CITIES
 
-    tasks = [_fetch_craigslist_city(client, city, query) for city in cities_to_search]
-    results_nested = await asyncio.gather(*tasks, return_exceptions=True)
+    sem = asyncio.Semaphore(CRAIGSLIST_MAX_CONCURRENCY)
+
+    async def _bounded(city: str) -> list[dict]:
+        async with sem:
+            return await _fetch_craigslist_city(client, city, query)
 
+    # Filter each city's listings as soon as that city returns
+    tasks = [asyncio.create_task(_bounded(city)) for city in cities_to_search]
+    kw_re = _keyword_pattern(tuple(match_kws))
     results: list[SourcedCompany] = []
-    for r in results_nested:
-        if not isinstance(r, list):
+    seen_urls: set[str] = set()  # nearby cities cross-post the same listing
+    for next_city in asyncio.as_completed(tasks):
+        try:
+            r = await next_city
+        except Exception:
             continue
         for item in r:
+            url = item.get("url", "")
+            if url and url in seen_urls:
+                continue
             combined = f"{item['name']} {item['description']}".lower()
-            if match_kws and not _text_matches_any(combined, match_kws):
+            if kw_re is not None and not kw_re.search(combined):
                 continue
+            if url:
+                seen_urls.add(url)
             results.append(SourcedCompany(
                 name=item["name"],
                 source="Craigslist",
-                source_url=item.get("url", ""),
+                source_url=url,
                 description=item.get("description", ""),
                 sector=sector,
                 location=item.get("location", ""),
@@ -539,6 +759,101 @@ async def search_craigslist(
 # Source 3: QuietLight Brokerage (733 server-rendered listings)
 # ---------------------------------------------------------------------------
 
+def _iter_quietlight_cards(content: bytes, encoding: Optional[str]):
+    """
+    Stream-parse the listings page, yielding each `div.listing-card.grid-item`
+    once it is complete. Each card (and everything before it) is freed after
+    the consumer is done with it, so peak memory stays near one card rather
+    than the full 733-card DOM.
+    """
+    for _, elem in etree.iterparse(
+        io.BytesIO(content), events=("end",), tag="div", html=True, encoding=encoding or "utf-8",
+    ):
+        classes = (elem.get("class") or "").split()
+        if "listing-card" not in classes or "grid-item" not in classes:
+            continue
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _parse_quietlight_card(card, sector: str) -> Optional[SourcedCompany]:
+    body = _first(_QL_BODY_XP, card)
+    if body is None:
+        body = card
+    full_text = _el_text(body, " ")
+
+    # Extract name — first heading or strong
+    name_el = _first(_QL_NAME_XP, body)
+    name = _el_text(name_el) if name_el is not None else ""
+    if not name:
+        # Fallback: first 60 chars of text
+        name = full_text[:60].strip()
+    if not name or len(name) < 4:
+        return None
+
+    # QuietLight returns all listings; scorer will rank by relevance
+    # (no keyword pre-filter — too many legitimate listings would be dropped)
+
+    # Link
+    link_el = _first(_FIRST_LINK_XP, card)
+    link = link_el.get("href") if link_el is not None else ""
+    if link and not link.startswith("http"):
+        link = f"https://www.quietlight.com{link}"
+
+    # Prices / revenue
+    asking = _extract_money(full_text)
+    revenue = ""
+    rev_m = _RE_REVENUE.search(full_text)
+    if rev_m:
+        revenue = rev_m.group(1)
+
+    # Extract actual listing category from card classes or bottom text
+    listing_sector = ""
+    bottom_el = _first(_QL_BOTTOM_XP, card)
+    if bottom_el is not None:
+        btxt = _el_text(bottom_el, " ")
+        # Last token of bottom is usually the category tag (e.g. "Ecommerce", "SaaS")
+        parts = [p.strip() for p in btxt.split() if len(p.strip()) > 2]
+        if parts:
+            listing_sector = parts[-1]
+    if not listing_sector:
+        # Fallback: check card CSS classes for type tags
+        card_classes = card.get("class", "")
+        for cls in ["ecommerce", "saas", "amazon", "content", "service", "app", "software"]:
+            if cls in card_classes.lower():
+                listing_sector = cls.title()
+                break
+
+    return SourcedCompany(
+        name=name,
+        source="QuietLight",
+        source_url=link,
+        description=full_text[:350],
+        sector=listing_sector or sector,
+        revenue=revenue,
+        asking_price=asking,
+    )
+
+
+def _parse_quietlight_page(
+    content: bytes,
+    encoding: Optional[str],
+    sector: str,
+) -> tuple[int, list[SourcedCompany]]:
+    """Stream-parse the whole listings page; returns (raw card count, companies)."""
+    raw_cards = 0
+    results: list[SourcedCompany] = []
+    for card in _iter_quietlight_cards(content, encoding):
+        raw_cards += 1
+        co = _parse_quietlight_card(card, sector)
+        if co is None:
+            continue
+        results.append(co)
+    return raw_cards, results
+
+
 async def search_quietlight(
     client: httpx.AsyncClient,
     match_kws: list[str],
@@ -548,72 +863,16 @@ async def search_quietlight(
     try:
         resp = await client.get(
             "https://www.quietlight.com/listings/",
-            headers=BROWSER_HEADERS,
             follow_redirects=True,
         )
         if resp.status_code != 200:
             logger.warning(f"[QuietLight] status {resp.status_code}")
             return results
 
-        soup = BeautifulSoup(resp.text, "lxml")
-        cards = soup.select("div.listing-card.grid-item")
-        logger.info(f"[QuietLight] raw cards: {len(cards)}")
-
-        for card in cards:
-            body = card.select_one(".listing-card__body") or card
-            full_text = body.get_text(" ", strip=True)
-
-            # Extract name — first heading or strong
-            name_el = body.select_one("h2, h3, h4, strong, .listing-card__title, [class*=title]")
-            name = name_el.get_text(strip=True) if name_el else ""
-            if not name:
-                # Fallback: first 60 chars of text
-                name = full_text[:60].strip()
-            if not name or len(name) < 4:
-                continue
-
-            # QuietLight returns all listings; scorer will rank by relevance
-            # (no keyword pre-filter — too many legitimate listings would be dropped)
-
-            # Link
-            link_el = card.select_one("a[href]")
-            link = link_el["href"] if link_el else ""
-            if link and not link.startswith("http"):
-                link = f"https://www.quietlight.com{link}"
-
-            # Prices / revenue
-            asking = _extract_money(full_text)
-            revenue = ""
-            rev_m = re.search(r"[Rr]evenue[:\s]+(\$[\d,\.]+\s*[MKBmkb]?)", full_text)
-            if rev_m:
-                revenue = rev_m.group(1)
-
-            # Extract actual listing category from card classes or bottom text
-            listing_sector = ""
-            bottom_el = card.select_one(".listing-card__bottom, [class*=bottom], [class*=category], [class*=type]")
-            if bottom_el:
-                btxt = bottom_el.get_text(" ", strip=True)
-                # Last token of bottom is usually the category tag (e.g. "Ecommerce", "SaaS")
-                parts = [p.strip() for p in btxt.split() if len(p.strip()) > 2]
-                if parts:
-                    listing_sector = parts[-1]
-            if not listing_sector:
-                # Fallback: check card CSS classes for type tags
-                card_classes = " ".join(card.get("class", []))
-                for cls in ["ecommerce", "saas", "amazon", "content", "service", "app", "software"]:
-                    if cls in card_classes.lower():
-                        listing_sector = cls.title()
-                        break
-
-            results.append(SourcedCompany(
-                name=name,
-                source="QuietLight",
-                source_url=link,
-                description=full_text[:350],
-                sector=listing_sector or sector,
-                revenue=revenue,
-                asking_price=asking,
-            ))
+        raw_cards, results = await asyncio.to_thread(
+            _parse_quietlight_page, resp.content, resp.encoding, sector,
+        )
+        logger.info(f"[QuietLight] raw cards: {raw_cards}")
     except Exception as e:
         logger.warning(f"[QuietLight] error: {e}")
 
@@ -634,41 +893,41 @@ async def search_empire_flippers(
     try:
         resp = await client.get(
             "https://empireflippers.com/marketplace/",
-            headers=BROWSER_HEADERS,
             follow_redirects=True,
         )
         if resp.status_code != 200:
             logger.warning(f"[EmpireFlippers] status {resp.status_code}")
             return results
 
-        soup = BeautifulSoup(resp.text, "lxml")
-        cards = soup.select(".listing-item")
+        tree = await asyncio.to_thread(_parse_html, resp.text)
+        cards = _EF_CARD_XP(tree)
         logger.info(f"[EmpireFlippers] raw cards: {len(cards)}")
 
         for card in cards:
-            full_text = card.get_text(" ", strip=True)
+            # Whole-card text is only walked when a targeted sub-element is missing
+            full_text: Optional[str] = None
 
             # Listing number
-            num_el = card.select_one(".listing-number")
-            listing_num = num_el.get_text(strip=True) if num_el else ""
+            num_el = _first(_EF_NUM_XP, card)
+            listing_num = _el_text(num_el) if num_el is not None else ""
 
             # Details element (for description and name fallback)
-            details_el = card.select_one(".listing-details, [class*=details]")
-            details_text = details_el.get_text(" ", strip=True) if details_el else full_text
+            details_el = _first(_EF_DETAILS_XP, card)
+            if details_el is not None:
+                details_text = _el_text(details_el, " ")
+            else:
+                full_text = details_text = _el_text(card, " ")
 
             # Extract category from title/heading elements
-            title_el = card.select_one(
-                ".listing-title, h2, h3, h4, [class*=title], [class*=heading], [class*=name]"
-            )
-            if title_el:
-                name = title_el.get_text(strip=True)
+            title_el = _first(_EF_TITLE_XP, card)
+            if title_el is not None:
+                name = _el_text(title_el)
             else:
                 # Fallback: parse category from the status line
                 # Pattern in text: "New Listing {Category} Monetization {Type}"
-                m = re.search(
-                    r"(?:New Listing|Listing)\s+([A-Z][a-zA-Z\s&,/]+?)(?:\s+Monetization|\s+\$|\s+Unlock)",
-                    full_text
-                )
+                if full_text is None:
+                    full_text = _el_text(card, " ")
+                m = _RE_EF_LISTING.search(full_text)
                 if m:
                     name = f"{m.group(1).strip()} ({listing_num})"
                 elif listing_num:
@@ -685,17 +944,22 @@ async def search_empire_flippers(
             # EmpireFlippers returns all listings; scorer will rank by relevance
             # (no keyword pre-filter — only 22 total cards so show all)
 
-            link_el = card.select_one("a[href]")
-            link = link_el["href"] if link_el else ""
+            link_el = _first(_FIRST_LINK_XP, card)
+            link = link_el.get("href") if link_el is not None else ""
             if link and not link.startswith("http"):
                 link = f"https://empireflippers.com{link}"
 
-            price_el = card.select_one(".listing-price")
-            price = price_el.get_text(strip=True) if price_el else _extract_money(full_text)
+            price_el = _first(_EF_PRICE_XP, card)
+            if price_el is not None:
+                price = _el_text(price_el)
+            else:
+                if full_text is None:
+                    full_text = _el_text(card, " ")
+                price = _extract_money(full_text)
 
             # Use the category already embedded in the name as the sector
             # e.g. name = "Supplements (#88319)" → sector = "Supplements"
-            listing_sector = re.sub(r"\s*\(#\d+\)\s*$", "", name).strip()
+            listing_sector = _RE_EF_SUFFIX.sub("", name).strip()
 
             results.append(SourcedCompany(
                 name=name,
@@ -723,33 +987,34 @@ async def search_fe_international(
 ) -> list[SourcedCompany]:
     results: list[SourcedCompany] = []
     try:
-        resp = await client.get("https://feinternational.com/buy-a-website/", headers=BROWSER_HEADERS, follow_redirects=True)
+        resp = await client.get("https://feinternational.com/buy-a-website/", follow_redirects=True)
         if resp.status_code != 200:
             return results
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = await asyncio.to_thread(_parse_html, resp.text)
+        kw_re = _keyword_pattern(tuple(match_kws))
         # Webflow CMS items
-        for item in soup.select(".w-dyn-item"):
-            name_el = item.select_one("h1, h2, h3, h4, [class*=title], [class*=heading], strong")
-            if not name_el:
+        for item in _FE_ITEM_XP(tree):
+            name_el = _first(_FE_NAME_XP, item)
+            if name_el is None:
                 continue
-            name = name_el.get_text(strip=True)
+            name = _el_text(name_el)
             if not name or len(name) < 4:
                 continue
 
-            desc_el = item.select_one("p, [class*=desc], [class*=summary]")
-            desc = desc_el.get_text(strip=True)[:300] if desc_el else ""
+            desc_el = _first(_FE_DESC_XP, item)
+            desc = _el_text(desc_el)[:300] if desc_el is not None else ""
 
-            link_el = item.select_one("a[href]")
-            link = link_el["href"] if link_el else ""
+            link_el = _first(_FIRST_LINK_XP, item)
+            link = link_el.get("href") if link_el is not None else ""
             if link and not link.startswith("http"):
                 link = f"https://feinternational.com{link}"
 
-            price_el = item.select_one("[class*=price], [class*=asking]")
-            price = price_el.get_text(strip=True) if price_el else ""
+            price_el = _first(_FE_PRICE_XP, item)
+            price = _el_text(price_el) if price_el is not None else ""
 
             combined = f"{name} {desc}".lower()
-            if match_kws and not _text_matches_any(combined, match_kws):
+            if kw_re is not None and not kw_re.search(combined):
                 continue
 
             results.append(SourcedCompany(
@@ -780,25 +1045,28 @@ async def search_axial(
     try:
         query = keywords or sector or "business acquisition"
         url = f"https://www.axial.net/forum/companies/?{urlencode({'q': query})}"
-        resp = await client.get(url, headers=BROWSER_HEADERS, follow_redirects=True)
+        resp = await client.get(url, follow_redirects=True)
         if resp.status_code != 200:
             return results
 
-        soup = BeautifulSoup(resp.text, "lxml")
-        for article in soup.select("article.teaser1")[:8]:
+        tree = await asyncio.to_thread(_parse_html, resp.text)
+        for article in _AX_ARTICLE_XP(tree)[:8]:
             try:
-                img = article.select_one("img[alt]")
-                name_el = article.select_one("[itemprop=name], h2, h3")
-                name = name_el.get_text(strip=True) if name_el else (img.get("alt", "") if img else "")
+                img = _first(_AX_IMG_XP, article)
+                name_el = _first(_AX_NAME_XP, article)
+                if name_el is not None:
+                    name = _el_text(name_el)
+                else:
+                    name = img.get("alt", "") if img is not None else ""
                 if not name or len(name) < 3:
                     continue
-                link_el = article.select_one("a[itemprop=url], a[href]")
+                link_el = _first(_AX_LINK_XP, article)
                 link = ""
-                if link_el:
+                if link_el is not None:
                     href = link_el.get("href", "")
                     link = href if href.startswith("http") else f"https://www.axial.net{href}"
-                desc_el = article.select_one("p, [itemprop=description]")
-                desc = desc_el.get_text(strip=True)[:200] if desc_el else ""
+                desc_el = _first(_AX_DESC_XP, article)
+                desc = _el_text(desc_el)[:200] if desc_el is not None else ""
                 results.append(SourcedCompany(
                     name=name,
                     source="Axial",
@@ -819,25 +1087,133 @@ async def search_axial(
 # Fit scorer — fully keyword-driven, no hardcoded sector maps
 # ---------------------------------------------------------------------------
 
+_RE_NONDIGIT_DOT = re.compile(r"[^\d.]")
+_RE_NONDIGIT = re.compile(r"[^\d]")
+# ASCII fast path for digit stripping; non-ASCII input falls back to the regex
+# so Unicode digits keep matching exactly as \d does.
+_ASCII_NONDIGIT_DELETE = {c: None for c in range(128) if not chr(c).isdigit()}
+
+
+def _digits_only(s: str) -> str:
+    if s.isascii():
+        return s.translate(_ASCII_NONDIGIT_DELETE)
+    return _RE_NONDIGIT.sub("", s)
+
+
+# Pure, and listings reuse a small vocabulary of price strings ("$1M", "$500K")
+@lru_cache(maxsize=4096)
 def _parse_money(s: str) -> Optional[float]:
     if not s:
         return None
     s = s.replace(",", "").replace("$", "").replace(" ", "").upper()
     try:
         if "B" in s:
-            return float(re.sub(r"[^\d.]", "", s.split("B")[0])) * 1e9
+            return float(_RE_NONDIGIT_DOT.sub("", s.split("B")[0])) * 1e9
         elif "M" in s:
-            return float(re.sub(r"[^\d.]", "", s.split("M")[0])) * 1e6
+            return float(_RE_NONDIGIT_DOT.sub("", s.split("M")[0])) * 1e6
         elif "K" in s:
-            return float(re.sub(r"[^\d.]", "", s.split("K")[0])) * 1e3
+            return float(_RE_NONDIGIT_DOT.sub("", s.split("K")[0])) * 1e3
         else:
-            v = float(re.sub(r"[^\d.]", "", s))
+            v = float(_RE_NONDIGIT_DOT.sub("", s))
             return v if v > 0 else None
     except Exception:
         return None
 
 
-def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[str]]:
+# Read-only closures keyed by token tuples — shared across searches (and the
+# /rescore endpoint) whose sector/keyword text tokenizes the same way.
+@lru_cache(maxsize=128)
+def _build_term_matcher(
+    sector_kws: tuple[str, ...],
+    keyword_kws: tuple[str, ...],
+) -> Callable[[str], tuple[list[str], list[str]]]:
+    """
+    Return match(text) -> (matched_sector, matched_keywords).
+
+    Each distinct token is scanned at most once per text: sector tokens first
+    (stopping there if the sector gate fails), then only the keyword tokens
+    that are not also sector tokens — shared ones reuse the sector result.
+    """
+    shared = frozenset(sector_kws) & frozenset(keyword_kws)
+
+    def match(text: str) -> tuple[list[str], list[str]]:
+        matched_sector = [kw for kw in sector_kws if kw in text]
+        if sector_kws and not matched_sector:
+            return matched_sector, []
+        sector_hits = frozenset(matched_sector) if shared else frozenset()
+        matched_kw = [
+            kw for kw in keyword_kws
+            if (kw in sector_hits if kw in shared else kw in text)
+        ]
+        return matched_sector, matched_kw
+
+    return match
+
+
+def _build_revenue_rule(
+    min_rev: Optional[float],
+    max_rev: Optional[float],
+) -> Optional[Callable[[float], Optional[tuple[int, str]]]]:
+    """
+    Resolve which revenue/price range branch applies once per search.
+    The returned rule maps a parsed value to (points, reason template) or None;
+    no rule at all means no revenue criteria, so parsing can be skipped.
+    """
+    if min_rev and max_rev:
+        def rule(v: float) -> Optional[tuple[int, str]]:
+            if min_rev <= v <= max_rev:
+                return 8, "✓ Revenue/price in range ({})"
+            return -4, "△ Revenue/price out of range ({})"
+    elif min_rev:
+        def rule(v: float) -> Optional[tuple[int, str]]:
+            return (4, "✓ Revenue ≥ min ({})") if v >= min_rev else None
+    elif max_rev:
+        def rule(v: float) -> Optional[tuple[int, str]]:
+            return (4, "✓ Revenue within max ({})") if v <= max_rev else None
+    else:
+        return None
+    return rule
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringTerms:
+    """Criteria-derived values — identical for every company in one search."""
+    sector: str
+    sector_kws: tuple[str, ...]
+    keyword_kws: tuple[str, ...]
+    location: str
+    loc_words: tuple[str, ...]
+    min_emp: Optional[int]
+    max_emp: Optional[int]
+    match: Callable[[str], tuple[list[str], list[str]]]
+    revenue_rule: Optional[Callable[[float], Optional[tuple[int, str]]]]
+
+
+def build_scoring_terms(criteria: dict) -> ScoringTerms:
+    """Read and tokenize the search criteria once, for reuse across a whole scoring loop."""
+    sector = (criteria.get("sector") or "").strip()
+    keywords = (criteria.get("keywords") or "").strip()
+    location = (criteria.get("location") or "").lower()
+    sector_kws = tuple(_build_sector_kws(sector))
+    keyword_kws = tuple(_build_keyword_kws(keywords))
+    return ScoringTerms(
+        sector=sector,
+        sector_kws=sector_kws,
+        keyword_kws=keyword_kws,
+        location=location,
+        loc_words=tuple(w for w in location.split() if len(w) > 2),
+        min_emp=criteria.get("min_employees"),
+        max_emp=criteria.get("max_employees"),
+        match=_build_term_matcher(sector_kws, keyword_kws),
+        revenue_rule=_build_revenue_rule(criteria.get("min_revenue"), criteria.get("max_revenue")),
+    )
+
+
+def score_company(
+    company: SourcedCompany,
+    criteria: dict,
+    terms: Optional[ScoringTerms] = None,
+) -> tuple[int, list[str]]:
     """
     Score 0–100.
 
@@ -852,33 +1228,39 @@ def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[st
 
     Everything else (location, revenue, completeness, source) adds
     incremental points on top of the sector+keyword base.
+
+    Pass `terms` (from build_scoring_terms) when scoring many companies
+    against the same criteria to skip re-tokenizing per company.
     """
     score = 0
     reasons: list[str] = []
 
-    sector = (criteria.get("sector") or "").strip()
-    keywords = (criteria.get("keywords") or "").strip()
-    location = (criteria.get("location") or "").lower()
-    min_emp = criteria.get("min_employees")
-    max_emp = criteria.get("max_employees")
-    min_rev = criteria.get("min_revenue")
-    max_rev = criteria.get("max_revenue")
+    if terms is None:
+        terms = build_scoring_terms(criteria)
+    sector_kws = terms.sector_kws
+
+    combined = company._search_text
+    if combined is None:
+        combined = company._search_text = " ".join(
+            (company.name or "", company.description or "", company.location or "")
+        ).lower()
 
-    combined = f"{company.name} {company.description} {company.location}".lower()
+    # Sector gate runs before anything else is read — most rejected listings
+    # cost only the text build and the sector-token scan.
+    matched_sector, matched_kw = terms.match(combined)
+    if sector_kws and not matched_sector:
+        reasons.append(f"✗ Sector '{terms.sector}' not found in listing")
+        return 0, reasons  # score 0, won't pass MIN_SCORE filter
 
-    sector_kws = _build_sector_kws(sector)
-    keyword_kws = _build_keyword_kws(keywords)
+    keyword_kws = terms.keyword_kws
+    location = terms.location
+    min_emp = terms.min_emp
+    max_emp = terms.max_emp
 
     # ----------------------------------------------------------------
     # PASS 1: Sector gate (0–55 pts)
     # ----------------------------------------------------------------
     if sector_kws:
-        matched_sector = [kw for kw in sector_kws if kw in combined]
-        if not matched_sector:
-            # Hard fail — listing doesn't mention the sector at all
-            reasons.append(f"✗ Sector '{sector}' not found in listing")
-            return 0, reasons  # Short-circuit: score 0, won't pass MIN_SCORE filter
-
         sector_ratio = len(matched_sector) / len(sector_kws)
         # All tokens match = 55, one of several = 20, only term = 40
         if len(sector_kws) == 1:
@@ -896,7 +1278,6 @@ def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[st
     # PASS 2: Keyword boost (0–25 pts) — only reached if sector passed
     # ----------------------------------------------------------------
     if keyword_kws:
-        matched_kw = [kw for kw in keyword_kws if kw in combined]
         if matched_kw:
             kw_ratio = len(matched_kw) / len(keyword_kws)
             kw_score = max(8, int(25 * kw_ratio))
@@ -911,10 +1292,8 @@ def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[st
     # This boost helps rank city-specific results above state-level ones.
     # ----------------------------------------------------------------
     if location:
-        loc_words = [w for w in location.split() if len(w) > 2]
-        loc_text = combined + " " + (company.location or "").lower()
-        matched_loc = [w for w in loc_words if w in loc_text]
-        if matched_loc:
+        # combined already ends with the lowercased location
+        if any(w in combined for w in terms.loc_words):
             score += 10
             reasons.append(f"✓ Location: {company.location or location}")
 
@@ -923,7 +1302,7 @@ def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[st
     # ----------------------------------------------------------------
     if company.employees:
         try:
-            emp_val = int(re.sub(r"[^\d]", "", company.employees.split("-")[0]))
+            emp_val = int(_digits_only(company.employees.split("-")[0]))
             if min_emp and max_emp and min_emp <= emp_val <= max_emp:
                 score += 8
                 reasons.append(f"✓ Employees in range ({emp_val:,})")
@@ -936,22 +1315,15 @@ def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[st
     # ----------------------------------------------------------------
     # Revenue / asking price range (+8 pts)
     # ----------------------------------------------------------------
-    rev_val = _parse_money(company.revenue or company.asking_price)
-    if rev_val is not None:
+    if terms.revenue_rule is not None:
         rev_str = company.revenue or company.asking_price
-        if min_rev and max_rev:
-            if min_rev <= rev_val <= max_rev:
-                score += 8
-                reasons.append(f"✓ Revenue/price in range ({rev_str})")
-            else:
-                score -= 4
-                reasons.append(f"△ Revenue/price out of range ({rev_str})")
-        elif min_rev and rev_val >= min_rev:
-            score += 4
-            reasons.append(f"✓ Revenue ≥ min ({rev_str})")
-        elif max_rev and rev_val <= max_rev:
-            score += 4
-            reasons.append(f"✓ Revenue within max ({rev_str})")
+        rev_val = _parse_money(rev_str)
+        if rev_val is not None:
+            outcome = terms.revenue_rule(rev_val)
+            if outcome:
+                points, reason = outcome
+                score += points
+                reasons.append(reason.format(rev_str))
 
     # ----------------------------------------------------------------
     # Data completeness bonus (+4 pts max)
@@ -982,6 +1354,17 @@ def score_company(company: SourcedCompany, criteria: dict) -> tuple[int, list[st
 # Main orchestration
 # ---------------------------------------------------------------------------
 
+def _score_all(companies: list[SourcedCompany], criteria: dict) -> None:
+    terms = build_scoring_terms(criteria)
+    for co in companies:
+        co.fit_score, co.fit_reasons = score_company(co, criteria, terms)
+
+
+# Name normalization for cross-source dedup
+_RE_NONWORD = re.compile(r"\W+")
+_RE_CORP_SUFFIX = re.compile(r"\b(llc|inc|corp|ltd|co|pllc|lp)\b")
+
+
 async def run_sourcing_search(criteria: dict) -> list[dict]:
     """
     Run all sources in parallel: deal-listing sites + active business discovery.
@@ -1008,35 +1391,58 @@ async def run_sourcing_search(criteria: dict) -> list[dict]:
 
     logger.info(f"[Sourcing] sector={sector!r} keywords={keywords!r} location={location!r} match_kws={match_kws}")
 
-    # Run ALL sources — listings AND discovery — in one parallel gather
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        listing_tasks = [
-            search_quietlight(client, match_kws, sector),
-            search_empire_flippers(client, match_kws, sector),
-            search_fe_international(client, match_kws, sector),
-            search_craigslist(client, match_kws, location_words, sector, keywords),
-            search_axial(client, sector, keywords),
-        ]
-        # Discovery runs in parallel with listing sources.
-        # Each Overpass city query has its own 12s per-city hard deadline via asyncio.wait_for
-        # inside _overpass_query, so no additional outer timeout is needed here.
-        discovery_task = run_discovery_search(criteria)
-
-        all_tasks = listing_tasks + [discovery_task]
-        all_results_nested = await asyncio.gather(*all_tasks, return_exceptions=True)
+    loc_filter_terms = _build_location_filter_terms(location)
 
-    listing_results_nested = all_results_nested[:-1]
-    discovery_result = all_results_nested[-1]
+    # Run ALL sources — listings AND discovery — concurrently
+    client = _get_client()
+    listing_tasks = [
+        asyncio.create_task(search_quietlight(client, match_kws, sector)),
+        asyncio.create_task(search_empire_flippers(client, match_kws, sector)),
+        asyncio.create_task(search_fe_international(client, match_kws, sector)),
+        asyncio.create_task(search_craigslist(client, match_kws, location_words, sector, keywords)),
+        asyncio.create_task(search_axial(client, sector, keywords)),
+    ]
+    # Discovery runs in parallel with listing sources.
+    # Each Overpass city query has its own 12s per-city hard deadline via asyncio.wait_for
+    # inside _overpass_query, so no additional outer timeout is needed here.
+    discovery_task = asyncio.create_task(run_discovery_search(criteria))
+
+    # Score each listing source as soon as it lands, overlapping that CPU work
+    # with the sources (usually discovery) still in flight. Results are kept
+    # per source so the merge/dedup below still sees them in source order.
+    listing_results: list[list[SourcedCompany]] = [[] for _ in listing_tasks]
+    task_index = {t: i for i, t in enumerate(listing_tasks)}
+    pending = set(listing_tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for t in done:
+            exc = t.exception()
+            if exc is not None:
+                logger.warning(f"[Sourcing] listing task error: {exc}")
+                continue
+            batch = t.result()
+            listing_results[task_index[t]] = batch
+            early = [co for co in batch if _result_passes_location_filter(co, loc_filter_terms)]
+            if early:
+                await asyncio.to_thread(_score_all, early, criteria)
 
-    # Gather deal-listing companies
+    # Gather deal-listing companies, dropping listings already seen by URL
     listing_companies: list[SourcedCompany] = []
-    for result in listing_results_nested:
-        if isinstance(result, Exception):
-            logger.warning(f"[Sourcing] listing task error: {result}")
-        elif isinstance(result, list):
-            listing_companies.extend(result)
+    seen_urls: set[str] = set()
+    for result in listing_results:
+        for co in result:
+            if co.source_url:
+                if co.source_url in seen_urls:
+                    continue
+                seen_urls.add(co.source_url)
+            listing_companies.append(co)
 
     # Discovery result (list of dicts)
+    try:
+        discovery_result = await discovery_task
+    except Exception as e:
+        logger.warning(f"[Sourcing] discovery task error: {e}")
+        discovery_result = []
     discovery_dicts = discovery_result if isinstance(discovery_result, list) else []
 
     # Convert discovery dicts back to SourcedCompany for unified dedup/sort
@@ -1062,50 +1468,53 @@ async def run_sourcing_search(criteria: dict) -> list[dict]:
     all_companies = listing_companies + discovery_companies
 
     # Deduplicate by normalized name (+ location for discovery to avoid cross-city collisions)
-    seen: set[str] = set()
+    # Keys are the normalized name, or a (name, location) tuple for discovery —
+    # no joined key string is built per company.
+    seen: set[str | tuple[str, str]] = set()
     deduped: list[SourcedCompany] = []
     for co in all_companies:
-        name_norm = re.sub(r"\W+", " ", co.name.lower()).strip()
-        name_norm = re.sub(r"\b(llc|inc|corp|ltd|co|pllc|lp)\b", "", name_norm).strip()
+        name_norm = _RE_NONWORD.sub(" ", co.name.lower()).strip()
+        name_norm = _RE_CORP_SUFFIX.sub("", name_norm).strip()
+        if len(name_norm) <= 2:
+            continue
         is_discovery = co.extra.get("listing_type") == "active_business"
         if is_discovery:
             # Include location in key for active businesses (same name, diff city = different biz)
-            loc_norm = re.sub(r"\W+", " ", co.location.lower()).strip()
-            key = f"{name_norm}|{loc_norm}"
+            loc_norm = _RE_NONWORD.sub(" ", co.location.lower()).strip()
+            key = (name_norm, loc_norm)
         else:
             key = name_norm
-        if key and len(name_norm) > 2 and key not in seen:
+        if key not in seen:
             seen.add(key)
             deduped.append(co)
 
-    # Score listing companies (discovery companies already scored)
-    for co in deduped:
-        if co.fit_score is None:
-            s, r = score_company(co, criteria)
-            co.fit_score = s
-            co.fit_reasons = r
-
-    deduped.sort(key=lambda c: c.fit_score or 0, reverse=True)
-
-    # Filter: only show listings that scored above the relevance threshold
-    has_criteria = bool(match_kws)
-    MIN_SCORE = 20 if has_criteria else 0
-    relevant = [co for co in deduped if (co.fit_score or 0) >= MIN_SCORE]
-
     # Location hard-filter: when a location is specified, only keep results
     # from that location or the same state. No random brokerage results from
     # across the country — if the user says "Houston", they want Houston.
-    loc_filter_terms = _build_location_filter_terms(location)
+    # Applied before scoring so rejected results are never scored.
+    candidates = deduped
     if loc_filter_terms:
-        before_ct = len(relevant)
-        relevant = [co for co in relevant if _result_passes_location_filter(co, loc_filter_terms)]
+        candidates = [co for co in deduped if _result_passes_location_filter(co, loc_filter_terms)]
         logger.info(
-            f"[Sourcing] Location filter '{location}' → {before_ct} → {len(relevant)} "
+            f"[Sourcing] Location filter '{location}' → {len(deduped)} → {len(candidates)} "
             f"(terms: {loc_filter_terms})"
         )
 
-    # Cap at 300 total (listings and active businesses combined)
-    final = relevant[:300]
+    # Score anything not already scored on arrival (discovery companies come
+    # pre-scored). Pure-Python CPU work — run it on a worker thread so the
+    # event loop keeps serving other requests (the GIL means one is enough).
+    to_score = [co for co in candidates if co.fit_score is None]
+    if to_score:
+        await asyncio.to_thread(_score_all, to_score, criteria)
+
+    # Filter: only show listings that scored above the relevance threshold
+    has_criteria = bool(match_kws)
+    MIN_SCORE = 20 if has_criteria else 0
+    relevant = [co for co in candidates if co.fit_score >= MIN_SCORE]
+
+    # Top 300 by score (listings and active businesses combined). Every
+    # fit_score is an int here; nlargest matches a stable sort + slice.
+    final = heapq.nlargest(300, relevant, key=attrgetter("fit_score"))
 
     listing_ct = sum(1 for co in final if not co.extra.get("listing_type"))
     discovery_ct = sum(1 for co in final if co.extra.get("listing_type") == "active_business")
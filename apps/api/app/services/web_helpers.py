@@ -8,11 +8,22 @@ Search provider chain: Serper.dev → Tavily → Google HTML scraping (fallback)
 from __future__ import annotations
 
 import asyncio
+import codecs
+import hashlib
 import logging
+import random
 import re
+import time
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlencode, urlparse
 
+import anthropic
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from cachetools import TTLCache
+from lxml import etree
+from lxml.html import HTMLParser, document_fromstring
 
 from app.config import settings
 
@@ -29,114 +40,360 @@ BROWSER_HEADERS = {
 
 SERPER_URL = "https://google.serper.dev/search"
 TAVILY_URL = "https://api.tavily.com/search"
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+
+# Search results are stable for hours, and enrichment re-issues the same
+# queries when a company is re-run — reuse non-empty results in-process.
+_SEARCH_CACHE_MAXSIZE = 4096
+_SEARCH_TEXT_CACHE: TTLCache = TTLCache(maxsize=_SEARCH_CACHE_MAXSIZE, ttl=settings.SEARCH_CACHE_TTL)
+_SEARCH_URL_CACHE: TTLCache = TTLCache(maxsize=_SEARCH_CACHE_MAXSIZE, ttl=settings.SEARCH_CACHE_TTL)
+
+
+# ---------------------------------------------------------------------------
+# lxml parsing helpers
+# ---------------------------------------------------------------------------
+
+_UTF8_HTML_PARSER = HTMLParser(encoding="utf-8")
+
+
+def _parse_html(html: str) -> etree._Element:
+    """Parse an HTML page with lxml (no BeautifulSoup wrapper objects)."""
+    try:
+        return document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an <?xml encoding=...?> declaration
+        return document_fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS `.name` class selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# BS4 get_text() leaves out script/style bodies — match that
+_TEXT_XP = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+
+def _el_text(el: etree._Element, sep: str = "") -> str:
+    return sep.join(t for t in (s.strip() for s in _TEXT_XP(el)) if t)
+
+
+# Google result-page selectors, hand-translated from CSS to XPath
+_GOOGLE_SNIPPET_XPS = [
+    etree.XPath(f"//div[{_has_class('VwiC3b')}]"),
+    etree.XPath("//div[@data-sncf]"),
+    etree.XPath(f"//span[{_has_class('aCOpRe')}]"),
+    etree.XPath(f"//div[{_has_class('IsZvec')}]"),
+]
+_GOOGLE_TITLE_XP = etree.XPath("//h3")
+# Absolute links inside organic result blocks (.yuRUbf ⊂ .tF2Cxc ⊂ .g), in
+# page order; any a[data-ved] link is only a fallback when those run short
+_GOOGLE_LINK_XPS = [
+    etree.XPath(
+        "//a[starts-with(@href, 'http')][ancestor::*["
+        f"{_has_class('yuRUbf')} or {_has_class('tF2Cxc')} or {_has_class('g')}"
+        "]]"
+    ),
+    etree.XPath("//a[@data-ved][starts-with(@href, 'http')]"),
+]
+_GOOGLE_REJECT_RE = re.compile(
+    r"google\.com/(?:search|imgres|maps)|accounts\.google|support\.google"
+    r"|translate\.google|webcache\.googleusercontent"
+)
+
+
+# ---------------------------------------------------------------------------
+# Per-host rate limiting
+# ---------------------------------------------------------------------------
+
+class HostRateLimiter:
+    """
+    Async token-bucket rate limiter keyed by hostname.
+    rates maps host -> (capacity, refill_per_second). Hosts not listed are
+    not limited, so only the provider that actually throttles slows down.
+    """
+
+    def __init__(self, rates: dict[str, tuple[float, float]]):
+        self._rates = rates
+        self._tokens: dict[str, float] = {}
+        self._updated: dict[str, float] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        host = host.lower().removeprefix("www.")
+        rate = self._rates.get(host)
+        if not rate:
+            return
+        capacity, refill = rate
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            tokens = self._tokens.get(host, capacity)
+            tokens = min(capacity, tokens + (now - self._updated.get(host, now)) * refill)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / refill)
+                now = time.monotonic()
+                tokens = 1
+            self._tokens[host] = tokens - 1
+            self._updated[host] = now
+
+
+_HOST_LIMITER = HostRateLimiter({
+    "google.com": (1, 1.0),       # HTML scraping — blocks quickly
+    "api.apollo.io": (10, 10.0),
+})
+
+
+async def wait_for_host(url: str) -> None:
+    """Wait until the rate limit for url's host allows another request."""
+    await _HOST_LIMITER.acquire(urlparse(url).netloc)
 
 
 # ---------------------------------------------------------------------------
-# URL fetching (unchanged)
+# URL fetching
 # ---------------------------------------------------------------------------
 
+_BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "header", "aside", "form", "noscript")
+
+
+def html_to_text(html: str, max_chars: int = 4000) -> str:
+    """Strip boilerplate tags from an HTML page and return its cleaned text."""
+    try:
+        root = _parse_html(html)
+    except etree.ParserError:  # empty document
+        return ""
+    # Empty the boilerplate elements in place rather than strip_elements(): the
+    # kept tail stays its own text node, so word boundaries match BS4 output
+    for el in list(root.iter(*_BOILERPLATE_TAGS)):
+        el.clear(keep_tail=True)
+    # str.split() strips and collapses every whitespace run in one C pass
+    text = " ".join(" ".join(root.itertext()).split())
+    return text[:max_chars]
+
+
+class _PageTextCollector:
+    """
+    lxml parser target that gathers the same text as html_to_text() while the
+    page is still being fed in, without building a tree. size tracks the
+    length of the joined output so the caller can stop reading early.
+    """
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self.size = 0
+        self._buf: list[str] = []
+        self._skip_depth = 0
+
+    def _flush(self) -> None:
+        # One text node ends at every tag/comment boundary, as in BS4
+        if self._buf:
+            text = " ".join("".join(self._buf).split())
+            self._buf.clear()
+            if text:
+                self.parts.append(text)
+                self.size += len(text) + 1
+
+    def start(self, tag, attrib) -> None:
+        self._flush()
+        if self._skip_depth or tag in _BOILERPLATE_TAGS:
+            self._skip_depth += 1
+
+    def end(self, tag) -> None:
+        self._flush()
+        if self._skip_depth:
+            self._skip_depth -= 1
+
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._buf.append(data)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def pi(self, target: str, data: str | None = None) -> None:
+        self._flush()
+
+    def close(self) -> str:
+        self._flush()
+        return " ".join(self.parts)
+
+
+_STREAM_CHUNK_SIZE = 16384
+
+
 async def fetch_url_text(client: httpx.AsyncClient, url: str, max_chars: int = 4000) -> str:
-    """Fetch a URL and return its cleaned text content."""
+    """
+    Fetch a URL and return its cleaned text content.
+    The body is streamed through an incremental lxml parser and the download
+    stops as soon as max_chars of text have been collected.
+    """
     try:
-        resp = await client.get(url, headers=BROWSER_HEADERS, follow_redirects=True, timeout=12)
-        if resp.status_code != 200:
-            return ""
-        soup = BeautifulSoup(resp.text, "lxml")
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside", "form", "noscript"]):
-            tag.decompose()
-        text = soup.get_text(" ", strip=True)
-        text = re.sub(r"\s{2,}", " ", text)
-        return text[:max_chars]
+        await wait_for_host(url)
+        async with client.stream(
+            "GET", url, headers=BROWSER_HEADERS, follow_redirects=True, timeout=12
+        ) as resp:
+            if resp.status_code != 200:
+                return ""
+            collector = _PageTextCollector()
+            parser = etree.HTMLParser(target=collector)
+            # Decode the way resp.text would (declared charset, else UTF-8)
+            decoder = codecs.getincrementaldecoder(resp.encoding)(errors="replace")
+            pending = ""
+            async for chunk in resp.aiter_bytes(_STREAM_CHUNK_SIZE):
+                # libxml2's push parser can miss a </script> or </style> split
+                # across two feeds, so only ever feed up to the last '>'
+                buf = pending + decoder.decode(chunk)
+                cut = buf.rfind(">") + 1
+                if cut:
+                    parser.feed(buf[:cut])
+                pending = buf[cut:]
+                if collector.size > max_chars:
+                    break  # leaving the block closes the connection
+            else:
+                pending += decoder.decode(b"", final=True)
+        if pending:
+            parser.feed(pending)
+        return parser.close()[:max_chars]
     except Exception as e:
         logger.debug(f"[Fetch] {url}: {e}")
         return ""
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP client — Serper/Tavily calls reuse one pooled (HTTP/2 where
+# supported) connection per API host instead of a TLS handshake per caller.
+# ---------------------------------------------------------------------------
+
+_CLIENT_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide web-helpers client, creating it on first use."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=_CLIENT_LIMITS)
+        _SHARED_CLIENT = httpx.AsyncClient(transport=transport, timeout=12)
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """Close the shared clients (called on app shutdown)."""
+    global _SHARED_CLIENT, _ANTHROPIC_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+    if _ANTHROPIC_CLIENT is not None:
+        await _ANTHROPIC_CLIENT.close()
+        _ANTHROPIC_CLIENT = None
+
+
 # ---------------------------------------------------------------------------
 # Search provider backends
 # ---------------------------------------------------------------------------
 
+# Tavily can inline extracted page content per result; anything past this is
+# pathological and is rejected rather than buffered and parsed
+_MAX_SEARCH_RESPONSE_BYTES = 2_000_000
+
+# Batch enrichment fans out hundreds of searches at once; queue them here
+# instead of tripping provider 429s and falling through to Google scraping
+_SERPER_SEM = asyncio.Semaphore(settings.SERPER_CONCURRENCY)
+_TAVILY_SEM = asyncio.Semaphore(settings.TAVILY_CONCURRENCY)
+
+
+async def _post_json(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str], payload: dict
+) -> dict:
+    """POST a JSON payload and parse the JSON reply, capped at _MAX_SEARCH_RESPONSE_BYTES."""
+    async with client.stream(
+        "POST", url, headers=headers, content=orjson.dumps(payload), timeout=12
+    ) as resp:
+        resp.raise_for_status()
+        if int(resp.headers.get("content-length") or 0) > _MAX_SEARCH_RESPONSE_BYTES:
+            raise ValueError(f"response too large ({resp.headers['content-length']} bytes)")
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in resp.aiter_bytes():
+            size += len(chunk)
+            if size > _MAX_SEARCH_RESPONSE_BYTES:
+                raise ValueError(f"response too large (>{_MAX_SEARCH_RESPONSE_BYTES} bytes)")
+            chunks.append(chunk)
+    return orjson.loads(b"".join(chunks))
+
+
 async def _serper_search(
-    client: httpx.AsyncClient, query: str, num_results: int = 5
+    query: str, num_results: int = 5, client: httpx.AsyncClient | None = None
 ) -> dict:
     """Call Serper.dev Google search API. Returns raw JSON response."""
-    resp = await client.post(
-        SERPER_URL,
-        headers={
-            "X-API-KEY": settings.SERPER_API_KEY,
-            "Content-Type": "application/json",
-        },
-        json={"q": query, "num": num_results},
-        timeout=12,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    async with _SERPER_SEM:
+        return await _post_json(
+            client or get_shared_client(),
+            SERPER_URL,
+            {
+                "X-API-KEY": settings.SERPER_API_KEY,
+                "Content-Type": "application/json",
+            },
+            {"q": query, "num": num_results},
+        )
 
 
 async def _tavily_search(
-    client: httpx.AsyncClient, query: str, max_results: int = 5
+    query: str, max_results: int = 5, client: httpx.AsyncClient | None = None
 ) -> dict:
     """Call Tavily AI search API. Returns raw JSON response."""
-    resp = await client.post(
-        TAVILY_URL,
-        headers={
-            "Authorization": f"Bearer {settings.TAVILY_API_KEY}",
-            "Content-Type": "application/json",
-        },
-        json={"query": query, "max_results": max_results},
-        timeout=12,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    async with _TAVILY_SEM:
+        return await _post_json(
+            client or get_shared_client(),
+            TAVILY_URL,
+            {
+                "Authorization": f"Bearer {settings.TAVILY_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            {"query": query, "max_results": max_results},
+        )
 
 
 async def _google_scrape_text(
     client: httpx.AsyncClient, query: str, max_chars: int = 3000
 ) -> str:
     """Legacy: scrape Google search results page for snippets (may be blocked)."""
-    url = f"https://www.google.com/search?q={query.replace(' ', '+')}&num=5"
+    url = f"{GOOGLE_SEARCH_URL}?{urlencode({'q': query, 'num': 5})}"
+    await wait_for_host(url)
     resp = await client.get(url, headers=BROWSER_HEADERS, follow_redirects=True, timeout=12)
     if resp.status_code != 200:
         return ""
-    soup = BeautifulSoup(resp.text, "lxml")
-    snippets = []
-    for sel in ["div.VwiC3b", "div[data-sncf]", "span.aCOpRe", "div.IsZvec"]:
-        for el in soup.select(sel):
-            text = el.get_text(" ", strip=True)
+    return _join_snippets(_google_snippets(_parse_html(resp.text)), max_chars, limit=12)
+
+
+def _google_snippets(root: etree._Element) -> Iterator[str]:
+    for xp in _GOOGLE_SNIPPET_XPS:
+        for el in xp(root):
+            text = _el_text(el, " ")
             if len(text) > 30:
-                snippets.append(text)
-    for h3 in soup.select("h3"):
-        text = h3.get_text(strip=True)
+                yield text
+    for h3 in _GOOGLE_TITLE_XP(root):
+        text = _el_text(h3)
         if len(text) > 10:
-            snippets.append(f"[Result] {text}")
-    combined = " | ".join(snippets[:12])
-    return combined[:max_chars]
+            yield f"[Result] {text}"
 
 
 async def _google_scrape_urls(
     client: httpx.AsyncClient, query: str, max_results: int = 5
 ) -> list[str]:
     """Legacy: scrape Google search results page for organic result URLs (may be blocked)."""
-    url = f"https://www.google.com/search?q={query.replace(' ', '+')}&num={max_results}"
+    url = f"{GOOGLE_SEARCH_URL}?{urlencode({'q': query, 'num': max_results})}"
+    await wait_for_host(url)
     resp = await client.get(url, headers=BROWSER_HEADERS, follow_redirects=True, timeout=12)
     if resp.status_code != 200:
         return []
-    soup = BeautifulSoup(resp.text, "lxml")
+    root = _parse_html(resp.text)
     urls: list[str] = []
     seen: set[str] = set()
-    for sel in [".yuRUbf a", ".tF2Cxc a", ".g a[href]", "a[data-ved]"]:
-        for a_tag in soup.select(sel):
-            href = a_tag.get("href", "")
-            if not href or not href.startswith("http"):
-                continue
-            if any(
-                d in href
-                for d in [
-                    "google.com/search", "google.com/imgres", "google.com/maps",
-                    "accounts.google", "support.google", "translate.google",
-                    "webcache.googleusercontent",
-                ]
-            ):
+    for xp in _GOOGLE_LINK_XPS:
+        for a_tag in xp(root):
+            href = a_tag.get("href")
+            if _GOOGLE_REJECT_RE.search(href):
                 continue
             if href not in seen:
                 seen.add(href)
@@ -148,6 +405,32 @@ async def _google_scrape_urls(
     return urls
 
 
+def _join_snippets(snippets: Iterable[str], max_chars: int, limit: Optional[int] = None) -> str:
+    """
+    " | ".join(snippets[:limit])[:max_chars], but stops pulling snippets once
+    the joined text already reaches max_chars (the rest would be cut anyway).
+    """
+    parts: list[str] = []
+    size = -3  # no separator before the first part
+    for snippet in snippets:
+        parts.append(snippet)
+        size += len(snippet) + 3
+        if size >= max_chars or len(parts) == limit:
+            break
+    return " | ".join(parts)[:max_chars]
+
+
+def _result_snippets(results: list[dict], body_key: str) -> Iterator[str]:
+    """Format Serper ("snippet") / Tavily ("content") results as [Result] lines."""
+    for result in results:
+        title = result.get("title", "")
+        body = result.get(body_key, "")
+        if body:
+            yield f"[Result] {title}: {body}"
+        elif title:
+            yield f"[Result] {title}"
+
+
 # ---------------------------------------------------------------------------
 # Public search API (transparent provider routing)
 # ---------------------------------------------------------------------------
@@ -158,44 +441,58 @@ async def google_search_text(
     """
     Search the web and return concatenated snippet text.
     Routes through: Serper.dev → Tavily → Google scraping (fallback).
+    Non-empty results are cached for settings.SEARCH_CACHE_TTL seconds.
     """
+    key = (query, max_chars)
+    cached = _SEARCH_TEXT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    text = await _search_text_uncached(client, query, max_chars)
+    if text:
+        _SEARCH_TEXT_CACHE[key] = text
+    return text
+
+
+async def _search_text_uncached(
+    client: httpx.AsyncClient, query: str, max_chars: int
+) -> str:
     # --- Provider 1: Serper.dev ---
     if settings.SERPER_API_KEY:
-        try:
-            data = await _serper_search(client, query, num_results=5)
-            snippets = []
-            for result in data.get("organic", []):
-                title = result.get("title", "")
-                snippet = result.get("snippet", "")
-                if snippet:
-                    snippets.append(f"[Result] {title}: {snippet}")
-                elif title:
-                    snippets.append(f"[Result] {title}")
-            combined = " | ".join(snippets)
-            if combined:
-                return combined[:max_chars]
-        except Exception as e:
-            logger.debug(f"[Serper] {query}: {e}")
+        combined = await _serper_text(query, max_chars)
+        if combined:
+            return combined
 
     # --- Provider 2: Tavily ---
     if settings.TAVILY_API_KEY:
-        try:
-            data = await _tavily_search(client, query, max_results=5)
-            snippets = []
-            for result in data.get("results", []):
-                title = result.get("title", "")
-                content = result.get("content", "")
-                if content:
-                    snippets.append(f"[Result] {title}: {content}")
-                elif title:
-                    snippets.append(f"[Result] {title}")
-            combined = " | ".join(snippets)
-            if combined:
-                return combined[:max_chars]
-        except Exception as e:
-            logger.debug(f"[Tavily] {query}: {e}")
+        combined = await _tavily_text(query, max_chars)
+        if combined:
+            return combined
 
     # --- Provider 3: Google HTML scraping (last resort) ---
+    return await _google_text(client, query, max_chars)
+
+
+async def _serper_text(query: str, max_chars: int) -> str:
+    """Serper.dev snippets joined into one string, or "" on error / no results."""
+    try:
+        data = await _serper_search(query, num_results=5)
+        return _join_snippets(_result_snippets(data.get("organic", []), "snippet"), max_chars)
+    except Exception as e:
+        logger.debug(f"[Serper] {query}: {e}")
+        return ""
+
+
+async def _tavily_text(query: str, max_chars: int) -> str:
+    """Tavily snippets joined into one string, or "" on error / no results."""
+    try:
+        data = await _tavily_search(query, max_results=5)
+        return _join_snippets(_result_snippets(data.get("results", []), "content"), max_chars)
+    except Exception as e:
+        logger.debug(f"[Tavily] {query}: {e}")
+        return ""
+
+
+async def _google_text(client: httpx.AsyncClient, query: str, max_chars: int) -> str:
     try:
         return await _google_scrape_text(client, query, max_chars)
     except Exception as e:
@@ -203,17 +500,82 @@ async def google_search_text(
         return ""
 
 
+async def google_search_text_racing(
+    client: httpx.AsyncClient,
+    query: str,
+    max_chars: int = 3000,
+    race_window: float = 0.5,
+) -> str:
+    """
+    Latency-oriented variant of google_search_text.
+
+    Serper gets a race_window head start; if it hasn't answered by then, Tavily
+    is fired too and whichever returns non-empty text first wins (the other is
+    cancelled). Tavily is billed per call, so batch enrichment keeps using the
+    sequential google_search_text — use this for interactive, one-off lookups.
+    """
+    key = (query, max_chars)
+    cached = _SEARCH_TEXT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    providers = []
+    if settings.SERPER_API_KEY:
+        providers.append(_serper_text)
+    if settings.TAVILY_API_KEY:
+        providers.append(_tavily_text)
+
+    text = ""
+    pending: set[asyncio.Task] = set()
+    try:
+        for provider in providers:
+            pending.add(asyncio.create_task(provider(query, max_chars)))
+            deadline = race_window if provider is not providers[-1] else None
+            while pending and not text:
+                done, pending = await asyncio.wait(
+                    pending, timeout=deadline, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break  # head start used up — bring in the next provider
+                text = next((t.result() for t in done if t.result()), "")
+            if text:
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if not text:
+        text = await _google_text(client, query, max_chars)
+    if text:
+        _SEARCH_TEXT_CACHE[key] = text
+    return text
+
+
 async def google_search_urls(
     client: httpx.AsyncClient, query: str, max_results: int = 5
 ) -> list[str]:
     """
     Search the web and return organic result URLs.
     Routes through: Serper.dev → Tavily → Google scraping (fallback).
+    Non-empty results are cached for settings.SEARCH_CACHE_TTL seconds.
     """
+    key = (query, max_results)
+    cached = _SEARCH_URL_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+    urls = await _search_urls_uncached(client, query, max_results)
+    if urls:
+        _SEARCH_URL_CACHE[key] = tuple(urls)
+    return urls
+
+
+async def _search_urls_uncached(
+    client: httpx.AsyncClient, query: str, max_results: int
+) -> list[str]:
     # --- Provider 1: Serper.dev ---
     if settings.SERPER_API_KEY:
         try:
-            data = await _serper_search(client, query, num_results=max_results)
+            data = await _serper_search(query, num_results=max_results)
             urls = [r["link"] for r in data.get("organic", []) if r.get("link")]
             if urls:
                 return urls[:max_results]
@@ -223,7 +585,7 @@ async def google_search_urls(
     # --- Provider 2: Tavily ---
     if settings.TAVILY_API_KEY:
         try:
-            data = await _tavily_search(client, query, max_results=max_results)
+            data = await _tavily_search(query, max_results=max_results)
             urls = [r["url"] for r in data.get("results", []) if r.get("url")]
             if urls:
                 return urls[:max_results]
@@ -239,7 +601,7 @@ async def google_search_urls(
 
 
 # ---------------------------------------------------------------------------
-# Claude API helper (unchanged)
+# Claude API helper
 # ---------------------------------------------------------------------------
 
 _CLAUDE_MODELS = [
@@ -247,67 +609,107 @@ _CLAUDE_MODELS = [
     "claude-3-haiku-20240307",    # fallback — always available, fast
 ]
 
+# One async SDK client (and its connection pool / TLS context) shared by every call
+_ANTHROPIC_CLIENT: anthropic.AsyncAnthropic | None = None
 
-async def call_claude_async(prompt: str, max_tokens: int = 800) -> str:
+
+def _get_anthropic() -> anthropic.AsyncAnthropic:
+    """Return the shared Anthropic client, creating it on first use."""
+    global _ANTHROPIC_CLIENT
+    if _ANTHROPIC_CLIENT is None:
+        # max_retries=0 disables the SDK's internal retry loop.
+        # We handle retries ourselves so we can fall through to the next model faster.
+        _ANTHROPIC_CLIENT = anthropic.AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY, max_retries=0
+        )
+    return _ANTHROPIC_CLIENT
+
+
+_CLAUDE_BACKOFF_BASE = 2  # seconds
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff (2s, 4s, 8s, ...) with ±50% jitter so workers that
+    were throttled together don't all retry in the same instant."""
+    return _CLAUDE_BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+# Responses for identical prompts, keyed by a prompt digest (opt-in per call)
+_CLAUDE_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=86400)
+
+
+def _claude_cache_key(prompt: str, max_tokens: int) -> tuple:
+    digest = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+    return (tuple(_CLAUDE_MODELS), max_tokens, digest)
+
+
+async def call_claude_async(prompt: str, max_tokens: int = 800, cache: bool = False) -> str:
     """Call Claude asynchronously with retry + model fallback.
 
     For each model in the fallback chain:
-      - Retries up to 3 times with exponential backoff (2s, 4s, 8s)
-        on 429 (rate-limited) or 529 (overloaded)
+      - Retries up to settings.CLAUDE_MAX_RETRIES times with jittered
+        exponential backoff (~2s, 4s, 8s) on 429 (rate-limited) or 529 (overloaded)
       - On 404 (model unavailable), skips to next model immediately
 
     Falls through the chain until one succeeds or all are exhausted.
+
+    With cache=True a non-empty response is reused for 24h whenever the exact
+    same prompt is sent again (re-running enrichment on a company). Leave it
+    off where a fresh generation is expected, e.g. regenerating email drafts.
     """
     if not settings.ANTHROPIC_API_KEY:
         return ""
 
-    import anthropic
-
-    MAX_RETRIES = 1
-    BASE_DELAY = 2  # seconds
-
-    def _call_sync() -> str:
-        # max_retries=0 disables the SDK's internal retry loop.
-        # We handle retries ourselves so we can fall through to the next model faster.
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY, max_retries=0)
-
-        for model in _CLAUDE_MODELS:
-            for attempt in range(MAX_RETRIES + 1):
-                try:
-                    message = client.messages.create(
-                        model=model,
-                        max_tokens=max_tokens,
-                        messages=[{"role": "user", "content": prompt}],
+    if cache:
+        key = _claude_cache_key(prompt, max_tokens)
+        cached = _CLAUDE_CACHE.get(key)
+        if cached is not None:
+            return cached
+        text = await _call_claude(prompt, max_tokens)
+        if text:
+            _CLAUDE_CACHE[key] = text
+        return text
+    return await _call_claude(prompt, max_tokens)
+
+
+async def _call_claude(prompt: str, max_tokens: int) -> str:
+    """Uncached request through the model fallback chain; returns "" if every model fails."""
+    max_retries = settings.CLAUDE_MAX_RETRIES
+    client = _get_anthropic()
+
+    for model in _CLAUDE_MODELS:
+        for attempt in range(max_retries + 1):
+            try:
+                message = await client.messages.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                if model != _CLAUDE_MODELS[0]:
+                    logger.info(f"[Claude] Used fallback model: {model}")
+                return message.content[0].text.strip()
+            except anthropic.APIStatusError as e:
+                if e.status_code == 404:
+                    # Model not available on this key — try next model
+                    logger.debug(f"[Claude] {model} not available (404), trying next")
+                    break
+                if e.status_code in (429, 529) and attempt < max_retries:
+                    delay = _backoff_delay(attempt)
+                    logger.info(
+                        f"[Claude] {model} returned {e.status_code} "
+                        f"(attempt {attempt + 1}), retrying in {delay:.1f}s..."
                     )
-                    if model != _CLAUDE_MODELS[0]:
-                        logger.info(f"[Claude] Used fallback model: {model}")
-                    return message.content[0].text.strip()
-                except anthropic.APIStatusError as e:
-                    if e.status_code == 404:
-                        # Model not available on this key — try next model
-                        logger.debug(f"[Claude] {model} not available (404), trying next")
-                        break
-                    if e.status_code in (429, 529) and attempt < MAX_RETRIES:
-                        delay = BASE_DELAY * (2 ** attempt)
-                        logger.info(
-                            f"[Claude] {model} returned {e.status_code} "
-                            f"(attempt {attempt + 1}), retrying in {delay}s..."
-                        )
-                        import time
-                        time.sleep(delay)
-                        continue
-                    # Last retry failed or non-retryable error
-                    logger.warning(f"[Claude] {model} failed: {e.status_code}")
-                    break  # try next model
-                except Exception as e:
-                    logger.warning(f"[Claude] {model} error: {e}")
-                    break  # try next model
-
-        logger.warning("[Claude] All models exhausted — returning empty")
-        return ""
-
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _call_sync)
+                    await asyncio.sleep(delay)
+                    continue
+                # Last retry failed or non-retryable error
+                logger.warning(f"[Claude] {model} failed: {e.status_code}")
+                break  # try next model
+            except Exception as e:
+                logger.warning(f"[Claude] {model} error: {e}")
+                break  # try next model
+
+    logger.warning("[Claude] All models exhausted — returning empty")
+    return ""
 
 
 # ---------------------------------------------------------------------------
@@ -341,59 +743,79 @@ _REGISTRY_DOMAINS = {
 }
 
 
+def _build_domain_trie(domains: set[str]) -> dict:
+    """Reversed-label trie: "google.com" → trie["com"]["google"][None] = True."""
+    trie: dict = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[None] = True
+    return trie
+
+
+_REGISTRY_TRIE = _build_domain_trie(_REGISTRY_DOMAINS)
+
+
+@lru_cache(maxsize=16384)
+def _is_registry_netloc(netloc: str) -> bool:
+    """Registry check on a bare netloc — cached, the same aggregators recur constantly."""
+    netloc = netloc.replace("www.", "").lower()
+    # Walk labels right-to-left; any registry domain reached along the way
+    # means netloc is that domain or one of its subdomains
+    node = _REGISTRY_TRIE
+    for label in reversed(netloc.split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if None in node:
+            return True
+    return False
+
+
 def _is_registry_or_aggregator(url: str) -> bool:
     """Check if a URL belongs to a registry/aggregator site (not the company's own site)."""
     try:
-        from urllib.parse import urlparse
-        netloc = urlparse(url).netloc.replace("www.", "").lower()
-        return any(netloc == d or netloc.endswith("." + d) for d in _REGISTRY_DOMAINS)
+        return _is_registry_netloc(urlparse(url).netloc)
     except Exception:
         return False
 
 
+# Common legal suffixes in one alternation — longer forms first, so at any
+# position the longest suffix wins, as the old one-pattern-per-pass order did
+_LEGAL_SUFFIX_RE = re.compile(
+    r",?\s*(?:Professional\s+Corporation|Medical\s+Corporation|Corporation|Corp\.?"
+    r"|Incorporated|Inc\.?|Limited|Ltd\.?|PLLC\.?|LLC\.?|L\.?P\.?|P\.?C\.?|P\.?A\.?)\b",
+    re.IGNORECASE,
+)
+_RE_TRAILING_PUNCT = re.compile(r"[,.\s]+$")
+
+
 def _clean_company_name(name: str) -> str:
     """Strip legal suffixes, punctuation, and extra whitespace from a company name."""
-    import re as _re
-    # Remove common legal suffixes — longer patterns first to avoid partial matches
-    suffixes = [
-        r",?\s*Professional\s+Corporation\b",
-        r",?\s*Medical\s+Corporation\b",
-        r",?\s*Corporation\b",
-        r",?\s*Corp\.?\b",
-        r",?\s*Incorporated\b",
-        r",?\s*Inc\.?\b",
-        r",?\s*Limited\b",
-        r",?\s*Ltd\.?\b",
-        r",?\s*PLLC\.?\b",
-        r",?\s*LLC\.?\b",
-        r",?\s*L\.?P\.?\b",
-        r",?\s*P\.?C\.?\b",
-        r",?\s*P\.?A\.?\b",
-    ]
-    cleaned = name
-    for suffix in suffixes:
-        cleaned = _re.sub(suffix, "", cleaned, flags=_re.IGNORECASE)
     # Remove trailing commas, periods, and extra whitespace
-    cleaned = _re.sub(r"[,.\s]+$", "", cleaned).strip()
-    return cleaned
+    return _RE_TRAILING_PUNCT.sub("", _LEGAL_SUFFIX_RE.sub("", name)).strip()
 
 
 def _extract_candidate_url(urls: list[str]) -> str:
     """From a list of search result URLs, return the best company website candidate."""
-    from urllib.parse import urlparse as _urlparse
+    # Parse each URL once and keep the non-aggregator ones, in order
+    candidates = []
     for url in urls:
-        if _is_registry_or_aggregator(url):
+        try:
+            parsed = urlparse(url)
+        except ValueError:
             continue
-        parsed = _urlparse(url)
+        if not _is_registry_netloc(parsed.netloc):
+            candidates.append(parsed)
+    for parsed in candidates:
         path = parsed.path.strip("/")
         # Prefer short paths (homepages, /about, /contact)
         if len(path.split("/")) <= 2:
             return f"{parsed.scheme}://{parsed.netloc}"
     # If no short path found, take the first non-aggregator result's domain
-    for url in urls:
-        if not _is_registry_or_aggregator(url):
-            parsed = _urlparse(url)
-            return f"{parsed.scheme}://{parsed.netloc}"
+    if candidates:
+        return f"{candidates[0].scheme}://{candidates[0].netloc}"
     return ""
 
 
@@ -407,14 +829,19 @@ async def discover_company_website(
     """
     clean_name = _clean_company_name(company_name)
 
-    # Strategy 1: Clean name + location + "official website"
+    # Strategy 1: Clean name + location + "official website" — both queries
+    # run concurrently; the first one still takes priority when both hit
     queries = [
         f'{clean_name} {location} official website',
         f'{clean_name} website',
     ]
-
-    for query in queries:
-        urls = await google_search_urls(client, query, max_results=8)
+    results = await asyncio.gather(
+        *(google_search_urls(client, query, max_results=8) for query in queries),
+        return_exceptions=True,
+    )
+    for urls in results:
+        if isinstance(urls, Exception):
+            continue
         candidate = _extract_candidate_url(urls)
         if candidate:
             return candidate